@@ -1,45 +1,136 @@
+import asyncio
 import os
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, FileResponse
+from starlette.responses import Response
 from starlette.routing import Route
 from starlette.requests import Request
 from datetime import datetime
-import numpy as np
 from backend.models.models import Company, Financial, DealPair, Valuation
-from backend.pdf_generator import generate_deal_brief
-from backend.valuation import (
-    calculate_base_fcf,
-    project_cash_flows,
-    calculate_dcf_confidence,
-    generate_dcf_sensitivity_grid,
-    assess_data_completeness
-)
-from backend.metrics import fetch_market_data
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
-from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+from cachetools import TTLCache
 from ..logger import setup_logger
+from ..db import init_db, AsyncSessionLocal
+
+# numpy, valuation (numba), metrics (yfinance/scipy), pdf_generator (reportlab),
+# pairing and ingest are imported lazily inside the handlers that need them so
+# cold starts and /health probes don't pay their import cost.
+
+try:
+    # libuv-backed event loop: cheaper readiness callbacks for the async
+    # session and thread-offload fan-out. uvicorn[standard] picks it up on
+    # its own; installing the policy here also covers embedded use.
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 logger = setup_logger(__name__)
-from datetime import datetime, timedelta
-import asyncio
-from collections import defaultdict
-from ..db import get_db, init_db, SessionLocal
-from .. import ingest as ingest_module
-import json
-from ..pairing import generate_top_pairs
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# When enabled, the static response envelope is pre-encoded once and only the
+# varying payload goes through orjson, instead of re-walking the full dict.
+_FAST_JSON_ENVELOPE = os.getenv("FAST_JSON_ENVELOPE", "false").lower() == "true"
+_DCF_ENVELOPE_PREFIX = b'{"meta":{"model":"DCF","timestamp":'
+_COMPS_ENVELOPE_PREFIX = b'{"meta":{"model":"Comps","timestamp":'
+_ENVELOPE_MID = b'},"data":'
+_ENVELOPE_END = b'}'
+
+
+def _render_envelope(prefix: bytes, timestamp: float, data: dict) -> bytes:
+    return b"".join([
+        prefix,
+        orjson.dumps(timestamp),
+        _ENVELOPE_MID,
+        orjson.dumps(data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY),
+        _ENVELOPE_END,
+    ])
+
+
+def _valuation_response(prefix: bytes, model: str, timestamp: float, data: dict) -> Response:
+    if _FAST_JSON_ENVELOPE:
+        return Response(_render_envelope(prefix, timestamp, data), media_type="application/json")
+    return ORJSONResponse({"meta": {"model": model, "timestamp": timestamp}, "data": data})
+
+
+# Serialized dcf/comps responses keyed by (model, data version, pair, assumptions).
+# _data_version is bumped after ingestion so stale entries stop matching.
+_valuation_cache = TTLCache(maxsize=1024, ttl=300)
+_data_version = 0
+
+
+def _bump_data_version() -> None:
+    global _data_version
+    _data_version += 1
+
+
+def _cache_key(model: str, pair_id: uuid.UUID, body: dict) -> Optional[tuple]:
+    try:
+        key = (model, _data_version, str(pair_id), tuple(sorted(body.items())))
+        hash(key)  # tuple() accepts dict/list values; hashing is what rejects them
+        return key
+    except TypeError:
+        # Unhashable assumption values (nested structures): skip caching
+        return None
+
+
+def _parse_pair_id(raw: str) -> Optional[uuid.UUID]:
+    """Parse a pair_id path param; UUID columns need uuid objects, not strings."""
+    try:
+        return uuid.UUID(raw)
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson.
+
+    orjson serializes numpy scalars/arrays and datetimes natively, which makes
+    it significantly faster than stdlib json for the large dcf/comps payloads.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
 
 
 async def on_startup() -> None:
 	init_db()
+	# Pay the numba compile cost at startup, not on the first request
+	from backend.valuation import warm_valuation_kernels
+	from backend.pairing import warm_pairing_kernels
+	warm_valuation_kernels()
+	warm_pairing_kernels()
 
 
-async def health(request: Request) -> JSONResponse:
-	return JSONResponse({"status": "ok"})
+async def health(request: Request) -> ORJSONResponse:
+	return ORJSONResponse({"status": "ok"})
 
 
 def create_mock_company(ticker: str) -> Company:
@@ -66,7 +157,7 @@ def create_mock_company(ticker: str) -> Company:
         net_debt=1e9
     )
 
-async def ingest_endpoint(request: Request) -> JSONResponse:
+async def ingest_endpoint(request: Request) -> ORJSONResponse:
     """Trigger ingestion. Query params: ?limit=50&mock=true"""
     params = request.query_params
     try:
@@ -76,12 +167,15 @@ async def ingest_endpoint(request: Request) -> JSONResponse:
         limit = 50
         use_mock = True
 
+    from .. import ingest as ingest_module
+
     # Run ingestion synchronously here; for large runs you should use background tasks or a worker.
     result = ingest_module.ingest_universe(limit=limit, use_mock=use_mock)
-    return JSONResponse(result)
+    _bump_data_version()  # invalidate cached valuations built on the old data
+    return ORJSONResponse(result)
 
 
-async def pairs_endpoint(request: Request) -> JSONResponse:
+async def pairs_endpoint(request: Request) -> ORJSONResponse:
     """Return top target pairs for an acquirer ticker. Query params: acquirer, top"""
     params = request.query_params
     acquirer = params.get("acquirer")
@@ -91,172 +185,260 @@ async def pairs_endpoint(request: Request) -> JSONResponse:
         top = 20
 
     if not acquirer:
-        return JSONResponse({"error": "missing acquirer parameter"}, status_code=400)
+        return ORJSONResponse({"error": "missing acquirer parameter"}, status_code=400)
 
     try:
+        from ..pairing import generate_top_pairs
+
         results = generate_top_pairs(acquirer.upper(), top=top)
-        return JSONResponse({"acquirer": acquirer.upper(), "top": top, "results": results})
+        return ORJSONResponse({"acquirer": acquirer.upper(), "top": top, "results": results})
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
+
+
+def _dcf_compute(financials, growth_rate, wacc, projection_years, terminal_growth) -> dict:
+    """Pure-CPU part of the dcf handler; runs on a worker thread so the
+    sensitivity grid and confidence scoring don't block the event loop."""
+    import numpy as np
+    from backend.valuation import (
+        calculate_base_fcf,
+        project_cash_flows,
+        calculate_dcf_confidence,
+        generate_dcf_sensitivity_grid,
+        assess_data_completeness
+    )
+
+    base_metrics = calculate_base_fcf(financials)
+    projection = project_cash_flows(base_metrics, growth_rate, projection_years)
+    projected_fcfs = projection["projected_fcfs"]  # already a float64 ndarray
+
+    # Terminal value, then discount all cash flows in one vectorized pass
+    terminal_value = float(projected_fcfs[-1]) * (1 + terminal_growth) / (wacc - terminal_growth)
+    discount_factors = np.power(1.0 + wacc, -np.arange(1, projection_years + 1))
+    pv_fcfs = float(np.dot(projected_fcfs, discount_factors))
+    pv_terminal = terminal_value * float(discount_factors[-1])
+
+    return {
+        "enterprise_value": pv_fcfs + pv_terminal,
+        "confidence": calculate_dcf_confidence(financials, growth_rate, wacc),
+        "base_metrics": base_metrics,
+        "projected_fcfs": projected_fcfs.tolist(),
+        "terminal_value": terminal_value,
+        "sensitivity": generate_dcf_sensitivity_grid(
+            base_metrics["base_fcf"], growth_rate, wacc, terminal_growth
+        ),
+        "data_completeness": assess_data_completeness(financials),
+        # Rows arrive ordered by year desc, so the first one is the latest --
+        # no need to rescan the list
+        "last_actual_year": financials[0].year if financials else None,
+    }
 
 
-async def dcf(request: Request) -> JSONResponse:
+async def dcf(request: Request) -> ORJSONResponse:
     """Calculate DCF valuation for a deal pair."""
     try:
-        pair_id = request.path_params.get("pair_id", "")
+        pair_id = _parse_pair_id(request.path_params.get("pair_id", ""))
+        if pair_id is None:
+            return ORJSONResponse({"error": "Pair not found"}, status_code=404)
         body = await request.json()
-        
-        session = SessionLocal()
-        pair = session.query(DealPair).filter(DealPair.id == pair_id).first()
-        if not pair:
-            return JSONResponse({"error": "Pair not found"}, status_code=404)
-            
-        # Get historical financials for target
-        target = pair.target
-        financials = session.query(Financial).filter(
-            Financial.company_id == target.id,
-            Financial.statement_type.ilike("%income%")
-        ).order_by(Financial.year.desc()).all()
-        
+
+        # Identical pair + assumptions: serve the pre-serialized response
+        cache_key = _cache_key("dcf", pair_id, body)
+        if cache_key is not None:
+            cached = _valuation_cache.get(cache_key)
+            if cached is not None:
+                return Response(cached, media_type="application/json")
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(DealPair)
+                .options(selectinload(DealPair.target))
+                .where(DealPair.id == pair_id)
+            )
+            pair = result.scalar_one_or_none()
+            if not pair:
+                return ORJSONResponse({"error": "Pair not found"}, status_code=404)
+
+            # Get historical financials for target. Select just the columns
+            # the valuation code reads: Core row tuples skip ORM hydration and
+            # their .year/.data attribute access bypasses the instrumented
+            # descriptors on Financial.
+            target = pair.target
+            result = await session.execute(
+                select(Financial.year, Financial.data)
+                .where(
+                    Financial.company_id == target.id,
+                    Financial.statement_type.ilike("%income%")
+                )
+                .order_by(Financial.year.desc())
+            )
+            financials = result.all()
+
         # Extract and process assumptions
         growth_rate = body.get("growth_rate", 0.03)
         wacc = body.get("wacc", 0.10)
         projection_years = body.get("projection_years", 5)
         terminal_growth = body.get("terminal_growth", 0.02)
-        
-        # Calculate projected cash flows
-        base_fcf = calculate_base_fcf(financials)
-        projected_fcfs = project_cash_flows(
-            base_fcf, 
-            growth_rate, 
-            projection_years
+
+        # Run the numeric block on a worker thread, off the event loop
+        computed = await asyncio.to_thread(
+            _dcf_compute, financials, growth_rate, wacc, projection_years, terminal_growth
         )
-        
-        # Calculate terminal value
-        terminal_value = projected_fcfs[-1] * (1 + terminal_growth) / (wacc - terminal_growth)
-        
-        # Discount all cash flows
-        discount_factors = [(1 + wacc) ** -i for i in range(1, projection_years + 1)]
-        pv_fcfs = sum(fcf * df for fcf, df in zip(projected_fcfs, discount_factors))
-        pv_terminal = terminal_value * discount_factors[-1]
-        
-        enterprise_value = pv_fcfs + pv_terminal
-        
-        # Calculate confidence score based on data quality
-        confidence = calculate_dcf_confidence(financials, growth_rate, wacc)
-        
-        return JSONResponse({
-            "meta": {
-                "model": "DCF",
-                "timestamp": datetime.now().timestamp()
-            },
-            "data": {
+
+        response = _valuation_response(
+            _DCF_ENVELOPE_PREFIX, "DCF", time.time(), {
                 "pair_id": pair_id,
-                "enterprise_value": enterprise_value,
-                "confidence": confidence,
+                "enterprise_value": computed["enterprise_value"],
+                "confidence": computed["confidence"],
                 "assumptions": {
                     "growth_rate": growth_rate,
                     "wacc": wacc,
                     "projection_years": projection_years,
                     "terminal_growth": terminal_growth,
-                    "base_fcf": base_fcf
+                    "base_fcf": computed["base_metrics"]
                 },
                 "projections": {
-                    "fcfs": projected_fcfs,
-                    "terminal_value": terminal_value
+                    "fcfs": computed["projected_fcfs"],
+                    "terminal_value": computed["terminal_value"]
                 },
-                "sensitivity": generate_dcf_sensitivity_grid(
-                    base_fcf, 
-                    growth_rate, 
-                    wacc, 
-                    terminal_growth
-                ),
+                "sensitivity": computed["sensitivity"],
                 "provenance": {
                     "source": "historical_financials",
-                    "data_completeness": assess_data_completeness(financials),
-                    "last_actual_year": max(f.year for f in financials) if financials else None
+                    "data_completeness": computed["data_completeness"],
+                    "last_actual_year": computed["last_actual_year"]
                 }
             }
-        })
+        )
+        if cache_key is not None:
+            _valuation_cache[cache_key] = response.body
+        return response
     except Exception as e:
         logger.exception("DCF calculation failed")
-        return JSONResponse({"error": str(e)}, status_code=500)
-    finally:
-        session.close()
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
-async def comps(request: Request) -> JSONResponse:
+async def comps(request: Request) -> ORJSONResponse:
     """Calculate valuation using comparable companies analysis."""
     try:
-        pair_id = request.path_params.get("pair_id", "")
-        session = SessionLocal()
-        
-        # Get the deal pair and target company
-        pair = session.query(DealPair).filter(DealPair.id == pair_id).first()
-        if not pair:
-            return JSONResponse({"error": "Pair not found"}, status_code=404)
-        
-        target = pair.target
-        
-        # Find comparable companies (same sector, similar size)
-        comparable_companies = session.query(Company).filter(
-            Company.sector == target.sector,
-            Company.id != target.id,
-            Company.market_cap.between(target.market_cap * 0.3, target.market_cap * 3.0)
-        ).limit(10).all()
-        
-        if not comparable_companies:
-            return JSONResponse({"error": "No comparable companies found"}, status_code=404)
-        
-        # Calculate multiples for each comparable
-        multiples = []
-        for comp in comparable_companies:
-            market_data = fetch_market_data(comp.ticker)
+        import numpy as np
+        from backend.metrics import fetch_market_data
+
+        pair_id = _parse_pair_id(request.path_params.get("pair_id", ""))
+        if pair_id is None:
+            return ORJSONResponse({"error": "Pair not found"}, status_code=404)
+
+        cache_key = _cache_key("comps", pair_id, {})
+        if cache_key is not None:
+            cached = _valuation_cache.get(cache_key)
+            if cached is not None:
+                return Response(cached, media_type="application/json")
+
+        async with AsyncSessionLocal() as session:
+            # Get the deal pair and target company
+            result = await session.execute(
+                select(DealPair)
+                .options(selectinload(DealPair.target))
+                .where(DealPair.id == pair_id)
+            )
+            pair = result.scalar_one_or_none()
+            if not pair:
+                return ORJSONResponse({"error": "Pair not found"}, status_code=404)
+
+            target = pair.target
+
+            # Latest income statement per company, resolved in SQL
+            latest_income_year = (
+                select(func.max(Financial.year))
+                .where(
+                    Financial.company_id == Company.id,
+                    Financial.statement_type.ilike("%income%")
+                )
+                .correlate(Company)
+                .scalar_subquery()
+            )
+
+            # Comparables (same sector, similar size) joined with their latest
+            # income statement in a single round-trip instead of N+1 queries
+            result = await session.execute(
+                select(Company.ticker, Company.market_cap, Financial.revenue, Financial.ebitda)
+                .join(Financial, Financial.company_id == Company.id)
+                .where(
+                    Company.sector == target.sector,
+                    Company.id != target.id,
+                    Company.market_cap.between(target.market_cap * 0.3, target.market_cap * 3.0),
+                    Financial.statement_type.ilike("%income%"),
+                    Financial.year == latest_income_year
+                )
+                .limit(10)
+            )
+            comp_rows = result.all()
+
+            # Get target financials while the session is still open
+            result = await session.execute(
+                select(Financial)
+                .where(
+                    Financial.company_id == target.id,
+                    Financial.statement_type.ilike("%income%")
+                )
+                .order_by(Financial.year.desc())
+                .limit(1)
+            )
+            target_financials = result.scalar_one_or_none()
+
+        if not comp_rows:
+            return ORJSONResponse({"error": "No comparable companies found"}, status_code=404)
+
+        # Materialize into struct-of-arrays for vectorized multiple math
+        comp_tickers = []
+        comp_mcaps = []
+        comp_revs = []
+        comp_ebitdas = []
+        comp_evs = []
+        # Fetch all market snapshots concurrently; each call is sync yfinance
+        # I/O, so fan them out onto the default threadpool
+        market_datas = await asyncio.gather(
+            *[asyncio.to_thread(fetch_market_data, row[0]) for row in comp_rows]
+        )
+
+        for (ticker, market_cap, revenue, ebitda), market_data in zip(comp_rows, market_datas):
             if not market_data:
                 continue
-                
-            financials = session.query(Financial).filter(
-                Financial.company_id == comp.id,
-                Financial.statement_type.ilike("%income%")
-            ).order_by(Financial.year.desc()).first()
-            
-            if not financials or not financials.data:
-                continue
-                
-            try:
-                revenue = float(financials.data.get("revenue", 0))
-                ebitda = float(financials.data.get("ebitda", 0))
-                
-                if revenue > 0 and ebitda > 0:
-                    ev = market_data.get("enterprise_value", comp.market_cap)
-                    multiples.append({
-                        "company": comp.ticker,
-                        "ev_revenue": ev / revenue,
-                        "ev_ebitda": ev / ebitda,
-                        "market_cap": comp.market_cap
-                    })
-            except (ValueError, TypeError):
-                continue
-        
-        if not multiples:
-            return JSONResponse({"error": "Could not calculate multiples"}, status_code=404)
-        
-        # Calculate median multiples
-        ev_revenue_median = np.median([m["ev_revenue"] for m in multiples])
-        ev_ebitda_median = np.median([m["ev_ebitda"] for m in multiples])
-        
-        # Get target financials
-        target_financials = session.query(Financial).filter(
-            Financial.company_id == target.id,
-            Financial.statement_type.ilike("%income%")
-        ).order_by(Financial.year.desc()).first()
-        
-        if not target_financials or not target_financials.data:
-            return JSONResponse({"error": "Target financials not found"}, status_code=404)
-        
-        # Calculate implied values
-        target_revenue = float(target_financials.data.get("revenue", 0))
-        target_ebitda = float(target_financials.data.get("ebitda", 0))
+            comp_tickers.append(ticker)
+            comp_mcaps.append(market_cap)
+            comp_revs.append(revenue or 0.0)
+            comp_ebitdas.append(ebitda or 0.0)
+            comp_evs.append(market_data.get("enterprise_value") or market_cap)
+
+        rev_arr = np.asarray(comp_revs, dtype=np.float64)
+        ebitda_arr = np.asarray(comp_ebitdas, dtype=np.float64)
+        ev_arr = np.asarray(comp_evs, dtype=np.float64)
+        valid = (rev_arr > 0) & (ebitda_arr > 0)
+
+        if not valid.any():
+            return ORJSONResponse({"error": "Could not calculate multiples"}, status_code=404)
+
+        ev_revenue = ev_arr[valid] / rev_arr[valid]
+        ev_ebitda = ev_arr[valid] / ebitda_arr[valid]
+        multiples = [
+            {
+                "company": comp_tickers[i],
+                "ev_revenue": float(ev_arr[i] / rev_arr[i]),
+                "ev_ebitda": float(ev_arr[i] / ebitda_arr[i]),
+                "market_cap": comp_mcaps[i]
+            }
+            for i in np.flatnonzero(valid)
+        ]
+
+        # Calculate median multiples on the contiguous arrays
+        ev_revenue_median = float(np.median(ev_revenue))
+        ev_ebitda_median = float(np.median(ev_ebitda))
+
+        if not target_financials:
+            return ORJSONResponse({"error": "Target financials not found"}, status_code=404)
+
+        # Calculate implied values from the typed columns
+        target_revenue = target_financials.revenue or 0.0
+        target_ebitda = target_financials.ebitda or 0.0
         
         implied_ev_revenue = target_revenue * ev_revenue_median
         implied_ev_ebitda = target_ebitda * ev_ebitda_median
@@ -267,12 +449,8 @@ async def comps(request: Request) -> JSONResponse:
         # Calculate confidence score based on data quality
         confidence = min(1.0, len(multiples) / 5.0)  # More comps = higher confidence
         
-        return JSONResponse({
-            "meta": {
-                "model": "Comps",
-                "timestamp": datetime.now().timestamp()
-            },
-            "data": {
+        response = _valuation_response(
+            _COMPS_ENVELOPE_PREFIX, "Comps", time.time(), {
                 "pair_id": pair_id,
                 "enterprise_value": enterprise_value,
                 "confidence": confidence,
@@ -291,30 +469,41 @@ async def comps(request: Request) -> JSONResponse:
                     "comps_tickers": [m["company"] for m in multiples]
                 }
             }
-        })
+        )
+        if cache_key is not None:
+            _valuation_cache[cache_key] = response.body
+        return response
     except Exception as e:
         logger.exception("Comps calculation failed")
-        return JSONResponse({"error": str(e)}, status_code=500)
-    finally:
-        session.close()
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
-async def generate_deal_brief_endpoint(request: Request) -> JSONResponse:
+async def generate_deal_brief_endpoint(request: Request) -> ORJSONResponse:
     """Generate a Deal Brief PDF for a pair."""
     try:
-        pair_id = request.path_params.get("pair_id", "")
-        session = SessionLocal()
-        
-        # Get the deal pair and related data
-        pair = session.query(DealPair).filter(DealPair.id == pair_id).first()
-        if not pair:
-            return JSONResponse({"error": "Pair not found"}, status_code=404)
-        
-        # Get valuation data
-        valuation = session.query(Valuation).filter(Valuation.pair_id == pair_id).first()
-        if not valuation:
-            return JSONResponse({"error": "Valuation not found"}, status_code=404)
-        
+        pair_id = _parse_pair_id(request.path_params.get("pair_id", ""))
+        if pair_id is None:
+            return ORJSONResponse({"error": "Pair not found"}, status_code=404)
+
+        async with AsyncSessionLocal() as session:
+            # Get the deal pair and related data
+            result = await session.execute(
+                select(DealPair)
+                .options(selectinload(DealPair.acquirer), selectinload(DealPair.target))
+                .where(DealPair.id == pair_id)
+            )
+            pair = result.scalar_one_or_none()
+            if not pair:
+                return ORJSONResponse({"error": "Pair not found"}, status_code=404)
+
+            # Get valuation data
+            result = await session.execute(
+                select(Valuation).where(Valuation.pair_id == pair_id)
+            )
+            valuation = result.scalars().first()
+            if not valuation:
+                return ORJSONResponse({"error": "Valuation not found"}, status_code=404)
+
         # Compile deal data
         deal_data = {
             "acquirer": pair.acquirer.ticker,
@@ -352,70 +541,74 @@ async def generate_deal_brief_endpoint(request: Request) -> JSONResponse:
             ]
         }
         
-        # Generate PDF
-        pdf_path = generate_deal_brief(deal_data)
-        
-        # Read PDF file
-        with open(pdf_path, 'rb') as f:
-            pdf_content = f.read()
-        
-        # Clean up temp file
-        os.remove(pdf_path)
-        
-        # Return PDF as download
-        return FileResponse(
-            pdf_content,
+        # Render in memory off the event loop; no temp file to create,
+        # stream back, or clean up afterwards
+        from backend.pdf_generator import generate_deal_brief_bytes
+
+        pdf_bytes = await asyncio.to_thread(generate_deal_brief_bytes, deal_data)
+
+        filename = f"deal_brief_{pair.acquirer.ticker}_{pair.target.ticker}.pdf"
+        return Response(
+            pdf_bytes,
             media_type='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename="deal_brief_{pair.acquirer.ticker}_{pair.target.ticker}.pdf"'
-            }
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
         )
-        
+
     except Exception as e:
         logger.exception("Deal brief generation failed")
-        return JSONResponse({"error": str(e)}, status_code=500)
-    finally:
-        session.close()
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 routes = [
     Route("/health", endpoint=health),
     Route("/ingest", endpoint=ingest_endpoint, methods=["POST", "GET"]),
     Route("/pairs", endpoint=pairs_endpoint, methods=["GET"]),
-    Route("/api/valuations/{pair_id}/dcf", endpoint=dcf),
+    Route("/api/valuations/{pair_id}/dcf", endpoint=dcf, methods=["POST"]),
     Route("/api/valuations/{pair_id}/comps", endpoint=comps),
     Route("/api/deal-brief/{pair_id}", endpoint=generate_deal_brief_endpoint),
 ]
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Fixed-window rate limiter: O(1) per request instead of rebuilding a
+    timestamp list per IP on every dispatch."""
+
+    SWEEP_INTERVAL = 10_000  # requests between sweeps of dead IP buckets
+
     def __init__(self, app, max_requests=100, window_seconds=60):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)
+        self.buckets = {}  # ip -> [window_index, count]
+        self._dispatch_count = 0
 
     async def dispatch(self, request, call_next):
-        now = datetime.now()
+        window = int(time.monotonic() // self.window_seconds)
         client_ip = request.client.host
 
-        # Clean old requests
-        self.requests[client_ip] = [ts for ts in self.requests[client_ip] 
-                                  if now - ts < timedelta(seconds=self.window_seconds)]
-        
+        bucket = self.buckets.get(client_ip)
+        if bucket is None or bucket[0] != window:
+            bucket = [window, 0]
+            self.buckets[client_ip] = bucket
+
         # Check rate limit
-        if len(self.requests[client_ip]) >= self.max_requests:
-            return JSONResponse(
+        if bucket[1] >= self.max_requests:
+            return ORJSONResponse(
                 {"error": "Rate limit exceeded. Please try again later."},
                 status_code=429
             )
+        bucket[1] += 1
+
+        # Periodically evict buckets from expired windows so memory stays bounded
+        self._dispatch_count += 1
+        if self._dispatch_count % self.SWEEP_INTERVAL == 0:
+            self.buckets = {
+                ip: b for ip, b in self.buckets.items() if b[0] >= window - 1
+            }
 
-        # Add current request
-        self.requests[client_ip].append(now)
-        
         try:
             response = await call_next(request)
             return response
         except Exception as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": str(e), "type": type(e).__name__},
                 status_code=500
             )
@@ -438,7 +631,7 @@ class InputValidationMiddleware(BaseHTTPMiddleware):
         if path == "/pairs" and "acquirer" in params:
             ticker = params["acquirer"]
             if not ticker.isalnum() or len(ticker) > 10:
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": "Invalid ticker format"},
                     status_code=400
                 )
@@ -1,7 +1,21 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from typing import Generator
+from typing import AsyncGenerator, Generator
+
+try:
+    import orjson
+
+    def _json_serializer(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_deserializer = orjson.loads
+except ImportError:  # orjson is optional; fall back to stdlib json
+    import json
+
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
 
 # Get database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ma_deals.db")
@@ -18,12 +32,35 @@ engine = create_engine(
     max_overflow=10,
     pool_timeout=30,
     pool_recycle=1800,  # Recycle connections after 30 minutes
+    # JSON columns (Financial.data, DealPair.metadata_json) go through the
+    # engine codec on every flush; orjson's C encoder beats stdlib json
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def _async_database_url(url: str) -> str:
+    """Map the sync database URL onto its async driver equivalent."""
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# Async engine/session for request handlers so DB I/O doesn't block the event loop
+async_engine = create_async_engine(
+    _async_database_url(DATABASE_URL),
+    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
 def get_db() -> Generator[Session, None, None]:
 	db = SessionLocal()
 	try:
@@ -32,9 +69,16 @@ def get_db() -> Generator[Session, None, None]:
 		db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+	async with AsyncSessionLocal() as session:
+		yield session
+
+
 def init_db() -> None:
     from .models.models import Base as ModelsBase
     from .indexes import create_indexes
-    
+    from .ingest import backfill_scalar_metrics
+
     ModelsBase.metadata.create_all(bind=engine)
     create_indexes()  # Create optimized indexes
+    backfill_scalar_metrics()  # Promote JSON metrics on pre-existing rows
@@ -1,29 +1,69 @@
-from sqlalchemy import Index, text
+import logging
+
+from sqlalchemy import Index
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from .db import engine
 from .models.models import Company, Financial, DealPair, Valuation
 
+logger = logging.getLogger(__name__)
+
+
 def create_indexes():
-    """Create database indexes for better query performance."""
-    # Company table indexes
-    Index('idx_company_market_cap', Company.market_cap)
-    Index('idx_company_sector_market_cap', Company.sector, Company.market_cap)
-    
-    # Financials table indexes
-    Index('idx_financials_company_type', 
-          Financial.company_id, 
-          Financial.statement_type)
-    Index('idx_financials_year_quarter', 
-          Financial.year, 
-          Financial.quarter)
-    
-    # DealPair table compound indexes
-    Index('idx_dealpair_scores', 
-          DealPair.compatibility_score.desc())
-    Index('idx_dealpair_acquirer_target', 
-          DealPair.acquirer_id, 
-          DealPair.target_id)
-    
-    # Valuation table indexes
-    Index('idx_valuation_scores',
-          Valuation.dcf_value,
-          Valuation.comps_value,
-          Valuation.ensemble_value)
\ No newline at end of file
+    """Create database indexes for better query performance.
+
+    The Index objects must be explicitly created against the engine —
+    constructing them alone does nothing at the database level.
+    """
+    indexes = [
+        # Company table indexes
+        Index('idx_company_market_cap', Company.market_cap),
+        Index('idx_company_sector_market_cap', Company.sector, Company.market_cap),
+
+        # Financials table indexes
+        Index('idx_financials_company_type',
+              Financial.company_id,
+              Financial.statement_type),
+        Index('idx_financials_year_quarter',
+              Financial.year,
+              Financial.quarter),
+        # Accelerates the "latest income statement" seek in dcf/comps
+        Index('idx_fin_income_year',
+              Financial.company_id,
+              Financial.year.desc(),
+              postgresql_where=Financial.statement_type.ilike("%income%")),
+        # Matches the filter + sort pattern of the growth-rate queries, so
+        # rows come back already ordered by year per company
+        Index('ix_fin_company_stmt_year',
+              Financial.company_id,
+              Financial.statement_type,
+              Financial.year),
+
+        # DealPair table compound indexes
+        Index('idx_dealpair_scores',
+              DealPair.compatibility_score.desc()),
+        Index('idx_dealpair_acquirer_target',
+              DealPair.acquirer_id,
+              DealPair.target_id),
+
+        # Valuation table indexes
+        Index('idx_valuation_scores',
+              Valuation.dcf_value,
+              Valuation.comps_value,
+              Valuation.ensemble_value),
+        # Freshness filters ("valuations updated since X") scan this column
+        Index('ix_valuation_last_updated',
+              Valuation.last_updated),
+    ]
+
+    # GIN over the JSONB payload enables containment/key lookups into
+    # Financial.data; only meaningful (and only valid) on Postgres
+    if engine.dialect.name == "postgresql":
+        indexes.append(Index('ix_financials_data_gin', Financial.data, postgresql_using='gin'))
+
+    for index in indexes:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except (OperationalError, ProgrammingError) as e:
+            # Databases created before a column existed (create_all never
+            # alters tables) shouldn't brick startup over a missing index
+            logger.warning("Skipping index %s: %s", index.name, e)
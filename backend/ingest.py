@@ -8,28 +8,63 @@ Note: network access is required to fetch data from Wikipedia and yfinance.
 If network calls fail, a small fallback ticker list will be used.
 """
 from typing import List, Dict, Any
+import json
+import os
 import time
+import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 import yfinance as yf
+from sqlalchemy import insert
 
 from .db import SessionLocal, init_db
+from .metrics import yf_session
 from .models.models import Company, Financial
 
 logger = logging.getLogger("backend.ingest")
 logging.basicConfig(level=logging.INFO)
 
 
+# The S&P 500 constituent list changes rarely; keep a local copy for a week
+# so repeat ingests skip the Wikipedia download + HTML parse entirely
+_SP500_CACHE_PATH = os.environ.get("SP500_CACHE_PATH", ".cache/sp500_tickers.json")
+_SP500_CACHE_TTL = 7 * 86400  # seconds
+
+
 def _get_sp500_tickers(limit: int) -> List[str]:
     """Try to fetch S&P 500 tickers from Wikipedia as a default universe.
 
-    Falls back to a small hard-coded list if the fetch fails.
+    Serves from a week-old-or-newer on-disk cache when available; falls
+    back to a small hard-coded list if both cache and fetch fail.
     """
     try:
-        tables = pd.read_html("https://en.wikipedia.org/wiki/List_of_S%26P_500_companies")
-        df = tables[0]
-        tickers = df["Symbol"].astype(str).tolist()
+        if time.time() - os.path.getmtime(_SP500_CACHE_PATH) < _SP500_CACHE_TTL:
+            with open(_SP500_CACHE_PATH) as fh:
+                return json.load(fh)[:limit]
+    except (OSError, ValueError):
+        pass  # no cache yet, stale, or unreadable -- fetch fresh
+
+    try:
+        # Pull just the ticker column with an XPath over the constituents
+        # table; pd.read_html would build and coerce full DataFrames for
+        # every table on the page only to keep one column of one of them
+        import requests
+        import lxml.html
+
+        resp = requests.get("https://en.wikipedia.org/wiki/List_of_S%26P_500_companies", timeout=10)
+        resp.raise_for_status()
+        doc = lxml.html.fromstring(resp.content)
+        tickers = [td.text_content().strip() for td in doc.xpath('//table[@id="constituents"]//tbody/tr/td[1]')]
+        if not tickers:
+            raise ValueError("no tickers parsed from constituents table")
+        try:
+            os.makedirs(os.path.dirname(_SP500_CACHE_PATH) or ".", exist_ok=True)
+            with open(_SP500_CACHE_PATH, "w") as fh:
+                json.dump(tickers, fh)
+        except OSError as e:
+            logger.warning("Could not write S&P500 ticker cache: %s", e)
         return tickers[:limit]
     except Exception as e:
         logger.warning("Could not fetch S&P500 list from Wikipedia: %s", e)
@@ -45,9 +80,126 @@ def _parse_period(col) -> Dict[str, Any]:
         return {"year": None, "quarter": None}
 
 
-def _create_mock_financial(company_id: int, stmt_type: str, year: int) -> Financial:
-    """Create mock financial statement data."""
-    mock_data = {
+def _normalize_values(values: Dict[str, Any]) -> Dict[str, float]:
+    """Coerce statement values to plain floats once at ingest.
+
+    Provider frames hand back numpy scalars and the odd string; coercing
+    here means every downstream valuation read gets a float without a
+    per-call cast. Junk values become 0.0, matching the read-side default.
+    """
+    out: Dict[str, float] = {}
+    for key, value in values.items():
+        try:
+            out[str(key)] = float(value) if value is not None else 0.0
+        except (TypeError, ValueError):
+            out[str(key)] = 0.0
+    return out
+
+
+def _extract_scalar_metrics(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the hot scalar metrics out of a statement's values dict.
+
+    Statement providers label these inconsistently ("Revenue", "Total
+    Revenue", "EBITDA", ...), so match case-insensitively. Done once at
+    ingest so downstream queries read typed columns instead of JSON.
+    """
+    metrics: Dict[str, Any] = {"revenue": None, "ebitda": None, "net_income": None, "operating_cf": None}
+    for key, value in values.items():
+        k = str(key).lower()
+        try:
+            if metrics["revenue"] is None and "revenue" in k:
+                metrics["revenue"] = float(value)
+            elif metrics["ebitda"] is None and "ebitda" in k:
+                metrics["ebitda"] = float(value)
+            elif metrics["net_income"] is None and "net income" in k:
+                metrics["net_income"] = float(value)
+            elif metrics["operating_cf"] is None and "operating cash flow" in k:
+                metrics["operating_cf"] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return metrics
+
+
+def backfill_scalar_metrics() -> int:
+    """Populate the typed scalar columns for rows ingested before they existed.
+
+    The comps query reads the typed revenue/ebitda/net_income/operating_cf
+    columns exclusively, so pre-series rows (all four NULL) silently
+    produced empty comps.
+    Extracts the metrics from data["values"] once and writes them back;
+    returns the number of rows updated. Safe to call on every startup.
+    """
+    from sqlalchemy import select, update
+    from sqlalchemy.exc import OperationalError, ProgrammingError
+
+    session = SessionLocal()
+    try:
+        rows = session.execute(
+            select(Financial.id, Financial.data).where(
+                Financial.revenue.is_(None),
+                Financial.ebitda.is_(None),
+                Financial.net_income.is_(None),
+                Financial.operating_cf.is_(None),
+            )
+        ).all()
+        payload = []
+        for fid, data in rows:
+            values = (data or {}).get("values") if isinstance(data, dict) else None
+            metrics = _extract_scalar_metrics(values or {})
+            if any(v is not None for v in metrics.values()):
+                payload.append({"id": fid, **metrics})
+        if payload:
+            session.execute(update(Financial), payload)
+            session.commit()
+            logger.info("Backfilled scalar metrics on %d financial rows", len(payload))
+        return len(payload)
+    except (OperationalError, ProgrammingError) as e:
+        # Schemas predating the typed columns can't be backfilled here;
+        # create_all doesn't alter tables, so just warn and move on
+        session.rollback()
+        logger.warning("Scalar-metric backfill skipped: %s", e)
+        return 0
+    finally:
+        session.close()
+
+
+# Flush accumulated rows to the DB once per this many tickers; per-row
+# commits dominate ingest time otherwise
+_INGEST_BATCH_SIZE = 100
+
+
+def _progress_level(i: int) -> int:
+    """INFO every 25th ticker (and the first), DEBUG otherwise.
+
+    Per-ticker INFO lines mean one write syscall per ticker over a
+    500-ticker run; keeping most at DEBUG batches the visible output.
+    """
+    return logging.INFO if i == 1 or i % 25 == 0 else logging.DEBUG
+
+# How many tickers to fetch from yfinance at once. Bounded so we stay
+# polite to the free API while still overlapping network latency.
+_FETCH_CONCURRENCY = 16
+
+
+def _fetch_ticker_data(ticker: str) -> Dict[str, Any]:
+    """Fetch info and statement frames for one ticker.
+
+    Runs on a worker thread. The shared session pools connections and
+    retries 429/5xx with backoff, so no explicit pause is needed.
+    """
+    t = yf.Ticker(ticker, session=yf_session)
+    info = t.info or {}
+    statements = {
+        "income": getattr(t, "financials", None),
+        "balance": getattr(t, "balance_sheet", None),
+        "cashflow": getattr(t, "cashflow", None),
+    }
+    return {"info": info, "statements": statements}
+
+
+def _mock_values_for_year(year: int) -> Dict[str, Dict[str, float]]:
+    """Mock statement values for one year, keyed by statement type."""
+    return {
         "income": {
             "Revenue": 1e10 * (1.1 ** (year - 2020)),
             "Net Income": 2e9 * (1.15 ** (year - 2020)),
@@ -64,19 +216,46 @@ def _create_mock_financial(company_id: int, stmt_type: str, year: int) -> Financ
             "Capital Expenditure": -5e8
         }
     }
-    
-    return Financial(
+
+
+# Mock statements are identical for every company, so build the per-year
+# values (and their promoted scalars) once instead of per company x year x
+# statement inside the ingest loop. Extra years memoize in on first use.
+_MOCK_STMTS: Dict[int, Dict[str, Dict[str, float]]] = {
+    year: _mock_values_for_year(year) for year in range(2023, 2026)
+}
+_MOCK_SCALARS: Dict[int, Dict[str, Dict[str, Any]]] = {
+    year: {st: _extract_scalar_metrics(vals) for st, vals in by_type.items()}
+    for year, by_type in _MOCK_STMTS.items()
+}
+
+
+def _create_mock_financial(company_id, stmt_type: str, year: int) -> Dict[str, Any]:
+    """Create mock financial statement data as a bulk-insert mapping."""
+    if year not in _MOCK_STMTS:
+        _MOCK_STMTS[year] = _mock_values_for_year(year)
+        _MOCK_SCALARS[year] = {
+            st: _extract_scalar_metrics(vals) for st, vals in _MOCK_STMTS[year].items()
+        }
+
+    return dict(
+        id=uuid.uuid4(),
         company_id=company_id,
         statement_type=stmt_type,
         period="annual",
         year=year,
         quarter=None,
-        data={"values": mock_data[stmt_type]}
+        data={"values": _MOCK_STMTS[year][stmt_type]},
+        **_MOCK_SCALARS[year][stmt_type]
     )
 
 def ingest_universe(limit: int = 200, pause: float = 2.0, use_mock: bool = True) -> Dict[str, Any]:
     """Ingest a universe of tickers into the backend DB with rate limiting.
 
+    `pause` is retained for backward compatibility but unused: rate
+    pressure is now handled by the shared session's retry/backoff plus the
+    bounded fetch concurrency.
+
     Returns a summary dict containing counts and any errors encountered.
     """
     init_db()
@@ -92,85 +271,111 @@ def ingest_universe(limit: int = 200, pause: float = 2.0, use_mock: bool = True)
         'META': ('Meta Platforms Inc.', 'Technology', 'Social Media')
     }
 
-    for i, ticker in enumerate(tickers, start=1):
-        if i > limit:
-            break
+    # Accumulate rows and bulk-insert once per batch: one commit per
+    # _INGEST_BATCH_SIZE tickers instead of two per ticker. Ids are
+    # generated client-side so financials can reference their company
+    # without a flush/refresh round-trip.
+    company_rows: List[Dict[str, Any]] = []
+    financial_rows: List[Dict[str, Any]] = []
+
+    def _flush_batch() -> None:
+        if not company_rows:
+            return
         try:
-            logger.info("Processing %s (%d/%d)", ticker, i, limit)
-            
-            if use_mock:
-                name, sector, industry = mock_data.get(ticker, (f"{ticker} Inc.", "Technology", "Software"))
-                company = Company(
-                    ticker=str(ticker),
-                    name=name,
-                    sector=sector,
-                    industry=industry,
-                    market_cap=1e11,
-                    revenue=1e10,
-                    net_income=2e9,
-                    employees=10000,
-                    ebitda=3e9,
-                    net_debt=1e9
-                )
-            else:
-                t = yf.Ticker(ticker)
-                info = t.info or {}
-
-                company = Company(
-                    ticker=str(ticker),
-                    name=info.get("longName") or info.get("shortName") or str(ticker),
-                    sector=info.get("sector"),
-                    market_cap=info.get("marketCap"),
-                )
-            
-            session.add(company)
+            session.bulk_insert_mappings(Company, company_rows)
+            session.bulk_insert_mappings(Financial, financial_rows)
             session.commit()
-            session.refresh(company)
-
-            if use_mock:
-                # Create mock financial statements for the last 3 years
-                current_year = 2025  # You can adjust this as needed
-                for year in range(current_year - 2, current_year + 1):
-                    for stmt_type in ["income", "balance", "cashflow"]:
-                        fin = _create_mock_financial(company.id, stmt_type, year)
-                        session.add(fin)
-                session.commit()
-            else:
-                # Real data ingestion from yfinance
-                statements = {
-                    "income": getattr(t, "financials", None),
-                    "balance": getattr(t, "balance_sheet", None),
-                    "cashflow": getattr(t, "cashflow", None),
-                }
-
-                for stmt_type, df in statements.items():
-                    try:
-                        if df is None or df.empty:
-                            continue
-                        for col in df.columns:
-                            per = _parse_period(col)
-                            data = df[col].fillna(0).to_dict()
-                            fin = Financial(
-                                company_id=company.id,
-                                statement_type=stmt_type,
-                                period="annual",
-                                year=per.get("year") or 0,
-                                quarter=per.get("quarter"),
-                                data={"values": data},
-                            )
-                            session.add(fin)
-                        session.commit()
-                except Exception as e:
-                    # Non-fatal for single statement
-                    logger.warning("Failed to ingest statement %s for %s: %s", stmt_type, ticker, e)
-
-            summary["processed"] += 1
-            # polite pause to reduce rate pressure on free services
-            time.sleep(pause)
         except Exception as e:
-            logger.exception("Error ingesting %s", ticker)
-            summary["errors"].append({"ticker": ticker, "error": str(e)})
+            session.rollback()
+            logger.exception("Batch insert failed")
+            summary["errors"].append({"batch": [c["ticker"] for c in company_rows], "error": str(e)})
+            summary["processed"] -= len(company_rows)
+        company_rows.clear()
+        financial_rows.clear()
+
+    def _ingest_mock_company(ticker: str) -> None:
+        company_id = uuid.uuid4()
+        name, sector, industry = mock_data.get(ticker, (f"{ticker} Inc.", "Technology", "Software"))
+        company_rows.append(dict(
+            id=company_id,
+            ticker=str(ticker),
+            name=name,
+            sector=sector,
+            industry=industry,
+            market_cap=1e11,
+            revenue=1e10,
+            net_income=2e9,
+            employees=10000,
+            ebitda=3e9,
+            net_debt=1e9
+        ))
+        # Create mock financial statements for the last 3 years
+        current_year = 2025  # You can adjust this as needed
+        for year in range(current_year - 2, current_year + 1):
+            for stmt_type in ["income", "balance", "cashflow"]:
+                financial_rows.append(_create_mock_financial(company_id, stmt_type, year))
+
+    def _ingest_fetched_company(ticker: str, payload: Dict[str, Any]) -> None:
+        company_id = uuid.uuid4()
+        info = payload["info"]
+        company_rows.append(dict(
+            id=company_id,
+            ticker=str(ticker),
+            name=info.get("longName") or info.get("shortName") or str(ticker),
+            sector=info.get("sector"),
+            market_cap=info.get("marketCap"),
+        ))
+        for stmt_type, df in payload["statements"].items():
+            try:
+                if df is None or df.empty:
+                    continue
+                for col in df.columns:
+                    per = _parse_period(col)
+                    values = _normalize_values(df[col].fillna(0).to_dict())
+                    financial_rows.append(dict(
+                        id=uuid.uuid4(),
+                        company_id=company_id,
+                        statement_type=stmt_type,
+                        period="annual",
+                        year=per.get("year") or 0,
+                        quarter=per.get("quarter"),
+                        data={"values": values},
+                        **_extract_scalar_metrics(values)
+                    ))
+            except Exception as e:
+                # Non-fatal for single statement
+                logger.warning("Failed to ingest statement %s for %s: %s", stmt_type, ticker, e)
+
+    if use_mock:
+        for i, ticker in enumerate(tickers[:limit], start=1):
+            try:
+                logger.log(_progress_level(i), "Processing %s (%d/%d)", ticker, i, limit)
+                _ingest_mock_company(ticker)
+                summary["processed"] += 1
+                if len(company_rows) >= _INGEST_BATCH_SIZE:
+                    _flush_batch()
+            except Exception as e:
+                logger.exception("Error ingesting %s", ticker)
+                summary["errors"].append({"ticker": ticker, "error": str(e)})
+    else:
+        # Producer/consumer split: worker threads fetch while this thread
+        # builds rows and commits batches, so DB I/O overlaps with the
+        # still-outstanding network fetches instead of running after them.
+        with ThreadPoolExecutor(max_workers=_FETCH_CONCURRENCY) as pool:
+            futures = {pool.submit(_fetch_ticker_data, t): t for t in tickers[:limit]}
+            for i, fut in enumerate(as_completed(futures), start=1):
+                ticker = futures[fut]
+                try:
+                    logger.log(_progress_level(i), "Processing %s (%d/%d)", ticker, i, len(futures))
+                    _ingest_fetched_company(ticker, fut.result())
+                    summary["processed"] += 1
+                    if len(company_rows) >= _INGEST_BATCH_SIZE:
+                        _flush_batch()
+                except Exception as e:
+                    logger.exception("Error ingesting %s", ticker)
+                    summary["errors"].append({"ticker": ticker, "error": str(e)})
 
+    _flush_batch()
     session.close()
     return summary
 
@@ -189,19 +394,29 @@ def seed_sample_universe() -> Dict[str, Any]:
         {"ticker": "TGT4", "name": "Target Delta", "sector": "Financials", "market_cap": 6e9},
     ]
     created = 0
-    for s in sample:
-        try:
-            c = Company(ticker=s["ticker"], name=s["name"], sector=s.get("sector"), market_cap=s.get("market_cap"))
-            session.add(c)
-            session.commit()
-            session.refresh(c)
+    try:
+        # Two Core executemany inserts + one commit instead of per-row
+        # add/commit/refresh; client-side ids let financials reference their
+        # company without a round-trip
+        company_rows = [
+            dict(id=uuid.uuid4(), ticker=s["ticker"], name=s["name"], sector=s.get("sector"), market_cap=s.get("market_cap"))
+            for s in sample
+        ]
+        financial_rows = []
+        for row in company_rows:
             # add a dummy income financial with revenue history
-            fin = Financial(company_id=c.id, statement_type="income", period="annual", year=2022, quarter=None, data={"values": {"Total Revenue": 1000.0 if s["ticker"].startswith("ACQ") else 100.0}})
-            session.add(fin)
-            session.commit()
-            created += 1
-        except Exception as e:
-            logger.warning("Failed to create sample company %s: %s", s.get("ticker"), e)
+            values = {"Total Revenue": 1000.0 if row["ticker"].startswith("ACQ") else 100.0}
+            financial_rows.append(dict(
+                id=uuid.uuid4(), company_id=row["id"], statement_type="income", period="annual",
+                year=2022, quarter=None, data={"values": values}, **_extract_scalar_metrics(values)
+            ))
+        session.execute(insert(Company), company_rows)
+        session.execute(insert(Financial), financial_rows)
+        session.commit()
+        created = len(company_rows)
+    except Exception as e:
+        session.rollback()
+        logger.warning("Failed to seed sample universe: %s", e)
     session.close()
     return {"created": created}
 
@@ -1,20 +1,30 @@
 import logging
 import sys
-from datetime import datetime
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
 import os
 
 def setup_logger(name: str) -> logging.Logger:
-    """Configure a logger with proper formatting and handlers."""
+    """Configure a logger with proper formatting and handlers.
+
+    Idempotent: repeated calls for the same name reuse the existing
+    handlers instead of stacking duplicates (which would emit every line
+    once per call site).
+    """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
+    # Handlers are attached here; don't re-emit through the root logger
+    logger.propagate = False
 
     # Create logs directory if it doesn't exist
     log_dir = os.path.join(os.path.dirname(__file__), 'logs')
     os.makedirs(log_dir, exist_ok=True)
 
-    # File handler - daily rotating
-    log_file = os.path.join(log_dir, f'{datetime.now().strftime("%Y-%m-%d")}.log')
-    file_handler = logging.FileHandler(log_file)
+    # File handler - rotates at midnight, keeps two weeks of history
+    file_handler = TimedRotatingFileHandler(
+        os.path.join(log_dir, 'app.log'), when='midnight', backupCount=14, encoding='utf-8'
+    )
     file_handler.setLevel(logging.INFO)
 
     # Console handler
@@ -28,12 +38,18 @@ def setup_logger(name: str) -> logging.Logger:
     console_formatter = logging.Formatter(
         '%(levelname)s - %(message)s'
     )
-    
+
     file_handler.setFormatter(file_formatter)
     console_handler.setFormatter(console_formatter)
 
+    # Buffer file output so tight loops pay one write() per ~200 records
+    # instead of one per record; warnings and errors flush immediately
+    buffered_file_handler = MemoryHandler(
+        capacity=200, flushLevel=logging.WARNING, target=file_handler
+    )
+
     # Add the handlers to the logger
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
     logger.addHandler(console_handler)
 
-    return logger
\ No newline at end of file
+    return logger
@@ -1,9 +1,12 @@
 import uuid
+from functools import cached_property
 from sqlalchemy import Column, String, Float, Integer, ForeignKey, UniqueConstraint, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from ..db import Base
 
+__all__ = ["Company", "Financial", "DealPair", "Valuation"]
+
 
 class Company(Base):
 	__tablename__ = "companies"
@@ -28,13 +31,31 @@ class Financial(Base):
 	period = Column(String(16), nullable=False)  # annual, quarterly
 	year = Column(Integer, nullable=False)
 	quarter = Column(Integer)
-	data = Column(JSON, nullable=False)
+	# JSONB on Postgres stores the payload pre-parsed (and can carry a GIN
+	# index); other dialects keep plain JSON
+	data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+	# Hot scalars promoted out of the JSON payload at ingest so valuation
+	# queries read typed columns instead of re-parsing JSON per row
+	revenue = Column(Float, index=True)
+	ebitda = Column(Float, index=True)
+	net_income = Column(Float)
+	operating_cf = Column(Float)
 
 	company = relationship("Company", back_populates="financials")
 	__table_args__ = (
 		UniqueConstraint("company_id", "statement_type", "period", "year", "quarter", name="uq_financials_unique_period"),
 	)
 
+	@cached_property
+	def values_dict(self):
+		"""The "values" sub-dict of the JSON payload, resolved once per instance.
+
+		Records are read-mostly after ingest, so caching the lookup is safe;
+		the cache lives in the instance __dict__ and dies with the object.
+		"""
+		data = self.data
+		return data.get("values", {}) if isinstance(data, dict) else {}
+
 
 class DealPair(Base):
 	__tablename__ = "deal_pairs"
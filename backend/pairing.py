@@ -5,14 +5,31 @@ companies for a given acquirer. The scoring is intentionally transparent and
 easy to extend: weights and sub-scores are visible and based on available data.
 """
 from typing import List, Dict, Any, Tuple, Optional
+import numpy as np
 from sqlalchemy.orm import Session
 from .db import SessionLocal
 from .models.models import Company, DealPair, Financial
 import math
+import os
+import re
 import logging
-from functools import lru_cache
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
 logger = logging.getLogger("backend.pairing")
 
 
@@ -46,86 +63,360 @@ def _size_score(acq_cap: float, tgt_cap: float) -> float:
             return 1.0 - (ratio - IDEAL_MAX) / (ABSOLUTE_MAX - IDEAL_MAX)
 
 
-def _sector_score(acq_sector: str, tgt_sector: str, acq_industry: str = None, tgt_industry: str = None) -> float:
-    """Calculate sector and industry compatibility score.
-    
-    Considers both sector-level matches and specific industry synergies:
-    - Perfect match (same sector & industry): 1.0
-    - Same sector, complementary industry: 0.8
-    - Same sector, different industry: 0.6
-    - Adjacent sectors with synergies: 0.3
-    - Others: 0.0
+def _size_scores(acq_cap: float, caps: np.ndarray) -> np.ndarray:
+    """Vectorized _size_score: score every candidate cap in one pass.
+
+    Same piecewise bands as the scalar version, assembled with np.select
+    instead of N Python calls with per-call branching.
+    """
+    if not acq_cap or acq_cap <= 0:
+        return np.zeros(caps.shape[0], dtype=np.float64)
+
+    ratio = caps / acq_cap
+    in_ideal = (ratio >= 0.10) & (ratio <= 0.50)
+    below = (ratio >= 0.05) & (ratio < 0.10)
+    above = (ratio > 0.50) & (ratio <= 0.70)
+    return np.select(
+        [in_ideal, below, above],
+        [
+            1.0,
+            (ratio - 0.05) / (0.10 - 0.05),
+            1.0 - (ratio - 0.50) / (0.70 - 0.50),
+        ],
+        default=0.0,
+    )
+
+
+# Sector adjacency and industry synergies. Module-level frozensets: the
+# lookup tables used to be rebuilt as dict literals on every _sector_score
+# call, which allocates per pair evaluation.
+_ADJACENT_SECTORS = {
+    'technology': frozenset({'communications', 'consumer cyclical'}),
+    'healthcare': frozenset({'technology', 'consumer defensive'}),
+    'financial': frozenset({'technology', 'real estate'}),
+    'consumer cyclical': frozenset({'technology', 'consumer defensive'}),
+    'industrial': frozenset({'technology', 'materials'})
+}
+
+# Complementary industries within sectors
+_COMPLEMENTARY = {
+    'technology': {
+        'software': frozenset({'semiconductors', 'hardware'}),
+        'hardware': frozenset({'software', 'semiconductors'}),
+        'semiconductors': frozenset({'hardware', 'software'})
+    }
+}
+
+
+def _norm_label(label: Optional[str]) -> str:
+    """Lowercased, stripped sector/industry label ('' when missing)."""
+    return label.strip().lower() if label else ''
+
+
+# Dense sector-by-sector score table over every sector the rule tables
+# know about: same sector 0.7, adjacent 0.3, else 0. Scoring a candidate
+# column against one acquirer becomes a single row gather instead of a
+# per-pair decision tree.
+_SECTOR_NAMES = sorted(
+    set(_ADJACENT_SECTORS) | {s for adj in _ADJACENT_SECTORS.values() for s in adj}
+)
+_SECTOR_ID = {name: i for i, name in enumerate(_SECTOR_NAMES)}
+_SECTOR_LUT = np.zeros((len(_SECTOR_NAMES), len(_SECTOR_NAMES)), dtype=np.float64)
+for _name, _sid in _SECTOR_ID.items():
+    _SECTOR_LUT[_sid, _sid] = 0.7
+    for _adj in _ADJACENT_SECTORS.get(_name, ()):
+        _SECTOR_LUT[_sid, _SECTOR_ID[_adj]] = 0.3
+
+
+def _sector_score_normalized(acq_sector: str, tgt_sector: str, acq_industry: str = '', tgt_industry: str = '') -> float:
+    """_sector_score over labels already passed through _norm_label.
+
+    Batch callers normalize each company's labels once and call this
+    directly, skipping the per-pair strip/lower.
     """
     if not acq_sector or not tgt_sector:
         return 0.0
-        
-    acq_sector = acq_sector.strip().lower()
-    tgt_sector = tgt_sector.strip().lower()
-    
-    # Define sector adjacency and synergies
-    ADJACENT_SECTORS = {
-        'technology': {'communications', 'consumer cyclical'},
-        'healthcare': {'technology', 'consumer defensive'},
-        'financial': {'technology', 'real estate'},
-        'consumer cyclical': {'technology', 'consumer defensive'},
-        'industrial': {'technology', 'materials'}
-    }
-    
+
     if acq_sector == tgt_sector:
         if acq_industry and tgt_industry:
-            acq_industry = acq_industry.strip().lower()
-            tgt_industry = tgt_industry.strip().lower()
             if acq_industry == tgt_industry:
                 return 1.0  # Perfect match
-            
-            # Define complementary industries within sectors
-            COMPLEMENTARY = {
-                'technology': {
-                    'software': {'semiconductors', 'hardware'},
-                    'hardware': {'software', 'semiconductors'},
-                    'semiconductors': {'hardware', 'software'}
-                }
-            }
-            
-            if acq_sector in COMPLEMENTARY:
-                if acq_industry in COMPLEMENTARY[acq_sector]:
-                    if tgt_industry in COMPLEMENTARY[acq_sector][acq_industry]:
-                        return 0.8  # Complementary industries
+
+            complementary = _COMPLEMENTARY.get(acq_sector)
+            if complementary and tgt_industry in complementary.get(acq_industry, ()):
+                return 0.8  # Complementary industries
             return 0.6  # Same sector, different industries
-            
+
         return 0.7  # Same sector, industries unknown
-    
+
     # Check for adjacent sector synergies
-    if acq_sector in ADJACENT_SECTORS and tgt_sector in ADJACENT_SECTORS[acq_sector]:
+    if tgt_sector in _ADJACENT_SECTORS.get(acq_sector, ()):
         return 0.3
-        
+
     return 0.0  # No clear synergies
 
 
-@lru_cache(maxsize=1000)
-def _get_cached_financials(company_id: str) -> List[Dict[str, Any]]:
-    """Cache financial data for companies to improve performance."""
-    session = SessionLocal()
+def _sector_score(acq_sector: str, tgt_sector: str, acq_industry: str = None, tgt_industry: str = None) -> float:
+    """Calculate sector and industry compatibility score.
+
+    Considers both sector-level matches and specific industry synergies:
+    - Perfect match (same sector & industry): 1.0
+    - Same sector, complementary industry: 0.8
+    - Same sector, different industry: 0.6
+    - Adjacent sectors with synergies: 0.3
+    - Others: 0.0
+    """
+    return _sector_score_normalized(
+        _norm_label(acq_sector), _norm_label(tgt_sector),
+        _norm_label(acq_industry), _norm_label(tgt_industry)
+    )
+
+
+def _sector_scores(acq_sector: Optional[str], sectors: List[Optional[str]]) -> np.ndarray:
+    """Batch _sector_score against one acquirer.
+
+    Candidate labels are factorized to integer codes, each distinct label
+    is scored once — via the _SECTOR_LUT row gather when the acquirer and
+    label are both enumerated, via the rule function otherwise (labels
+    outside the tables still score 0.7 on an exact match) — and the full
+    column comes back through one fancy-index.
+    """
+    acq_norm = _norm_label(acq_sector)
+    acq_sid = _SECTOR_ID.get(acq_norm)
+
+    codes = np.empty(len(sectors), dtype=np.intp)
+    code_of: Dict[str, int] = {}
+    labels: List[str] = []
+    for i, s in enumerate(sectors):
+        tgt_norm = _norm_label(s)
+        code = code_of.get(tgt_norm)
+        if code is None:
+            code = len(labels)
+            code_of[tgt_norm] = code
+            labels.append(tgt_norm)
+        codes[i] = code
+
+    per_label = np.empty(len(labels), dtype=np.float64)
+    for code, label in enumerate(labels):
+        sid = _SECTOR_ID.get(label)
+        if acq_sid is not None and sid is not None:
+            per_label[code] = _SECTOR_LUT[acq_sid, sid]
+        else:
+            per_label[code] = _sector_score_normalized(acq_norm, label)
+    return per_label[codes]
+
+
+# SQLite's default variable limit is ~999; stay under it when expanding IN()
+_PREFETCH_CHUNK = 900
+
+# Everything scoring reads from a candidate row. Fetching these as plain
+# Row tuples skips ORM object hydration (identity map, relationship
+# loaders) for every candidate in the universe.
+_CANDIDATE_COLS = (Company.id, Company.ticker, Company.name, Company.sector, Company.market_cap)
+
+
+def _prefetch_financials(session: Session, ids: List[Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Income statements for many companies, one query per ~900 ids.
+
+    Scoring a full candidate list through _get_cached_financials costs one
+    session open + SELECT per cold company; this loads the whole batch up
+    front and buckets rows by company id. Every requested id gets an entry.
+    """
+    financials_map: Dict[str, List[Dict[str, Any]]] = {str(cid): [] for cid in ids}
+    for start in range(0, len(ids), _PREFETCH_CHUNK):
+        chunk = ids[start:start + _PREFETCH_CHUNK]
+        rows = (
+            session.query(Financial.company_id, Financial.year, Financial.data)
+            .filter(Financial.company_id.in_(chunk))
+            .filter(Financial.statement_type == "income")
+            .order_by(Financial.company_id, Financial.year.desc())
+            .all()
+        )
+        for cid, year, data in rows:
+            financials_map[str(cid)].append({"year": year, "data": data})
+    return financials_map
+
+
+# Cross-request cache for one-off score_pair calls (batch scoring goes
+# through _prefetch_financials instead). TTL-bounded so re-ingested data
+# surfaces within the hour, unlike lru_cache's process-lifetime entries;
+# the lock makes it safe under threaded servers.
+_financials_cache: TTLCache = TTLCache(maxsize=1000, ttl=3600)
+_financials_cache_lock = threading.Lock()
+
+
+def _get_cached_financials(company_id: str, session: Optional[Session] = None) -> List[Dict[str, Any]]:
+    """Cache financial data for companies to improve performance.
+
+    Reuses the caller's session when given instead of opening one per miss.
+    """
+    with _financials_cache_lock:
+        cached = _financials_cache.get(company_id)
+    if cached is not None:
+        return cached
+
+    # The UUID(as_uuid=True) column needs a uuid object, not its string form
+    try:
+        cid = uuid.UUID(company_id)
+    except (ValueError, AttributeError, TypeError):
+        return []
+
+    owns_session = session is None
+    if owns_session:
+        session = SessionLocal()
     try:
-        financials = (
-            session.query(Financial)
-            .filter(Financial.company_id == company_id)
-            .filter(Financial.statement_type.ilike("%income%"))
+        rows = (
+            session.query(Financial.year, Financial.data)
+            .filter(Financial.company_id == cid)
+            .filter(Financial.statement_type == "income")
             .order_by(Financial.year.desc())
             .all()
         )
-        return [{"year": f.year, "data": f.data} for f in financials]
+        result = [{"year": year, "data": data} for year, data in rows]
     finally:
-        session.close()
+        if owns_session:
+            session.close()
+
+    with _financials_cache_lock:
+        _financials_cache[company_id] = result
+    return result
+
+# One alternation regex replaces the sequential substring scans when
+# classifying statement keys; the dict maps the matched keyword to its
+# column in the normalized array
+_METRIC_RE = re.compile(r"(revenue|sales|ebitda|net income)")
+_METRIC_COL = {"revenue": 1, "sales": 1, "ebitda": 2, "net income": 3}
+
+
+def _normalize_financials(financials: List[Dict[str, Any]]) -> np.ndarray:
+    """Normalize statement dicts to a (n_years, 4) float64 array.
+
+    Columns are (year, revenue, ebitda, net_income), sorted ascending by
+    year; NaN marks a metric missing for that year. The string matching
+    happens once here so the numeric kernel sees only arrays.
+    """
+    rows = []
+    for f in financials:
+        data = f.get("data", {})
+        values = data.get("values", {}) if isinstance(data, dict) else {}
+        year = f["year"]
+        row = [year, float("nan"), float("nan"), float("nan")]
+        for k, v in values.items():
+            if not isinstance(k, str):
+                continue
+            m = _METRIC_RE.search(k.lower())
+            if not m:
+                continue
+            col = _METRIC_COL[m.group(1)]
+            if not math.isnan(row[col]):
+                continue
+            try:
+                row[col] = float(v)
+            except (ValueError, TypeError):
+                continue
+        rows.append(tuple(row))
+    rows.sort(key=lambda r: r[0])
+    return np.array(rows, dtype=np.float64).reshape(len(rows), 4)
+
+
+@njit(cache=True)
+def _growth_kernel(arr):
+    """Numeric core of _calculate_growth_metrics over a normalized array.
+
+    Returns (revenue_growth, revenue_cagr, ebitda_margin, ebitda_growth,
+    net_margin, margin_trend).
+    """
+    n = arr.shape[0]
+    revenue_growth = 0.0
+    revenue_cagr = 0.0
+    ebitda_margin = 0.0
+    ebitda_growth = 0.0
+    net_margin = 0.0
+    margin_trend = 0.0
+
+    # Revenue series (rows with a revenue value, already year-sorted)
+    rev_count = 0
+    first_rev = 0.0
+    first_rev_year = 0.0
+    prev_rev = 0.0
+    last_rev = 0.0
+    last_rev_year = 0.0
+    for i in range(n):
+        r = arr[i, 1]
+        if not np.isnan(r):
+            if rev_count == 0:
+                first_rev = r
+                first_rev_year = arr[i, 0]
+            prev_rev = last_rev
+            last_rev = r
+            last_rev_year = arr[i, 0]
+            rev_count += 1
+
+    if rev_count >= 2:
+        if prev_rev > 0:
+            revenue_growth = last_rev / prev_rev - 1.0
+        span = last_rev_year - first_rev_year
+        if span > 0 and first_rev > 0:
+            revenue_cagr = (last_rev / first_rev) ** (1.0 / span) - 1.0
+
+    # EBITDA series: margin at the latest revenue year, growth over the
+    # last two observations
+    eb_count = 0
+    prev_eb = 0.0
+    last_eb = 0.0
+    eb_at_last_rev_year = 0.0
+    for i in range(n):
+        e = arr[i, 2]
+        if not np.isnan(e):
+            prev_eb = last_eb
+            last_eb = e
+            eb_count += 1
+            if rev_count > 0 and arr[i, 0] == last_rev_year:
+                eb_at_last_rev_year = e
+
+    if rev_count > 0 and eb_count > 0:
+        if last_rev > 0:
+            ebitda_margin = eb_at_last_rev_year / last_rev
+        if eb_count >= 2 and prev_eb > 0:
+            ebitda_growth = last_eb / prev_eb - 1.0
+
+    # Net margin trend across years where both revenue and net income exist
+    m_count = 0
+    first_margin = 0.0
+    last_margin = 0.0
+    for i in range(n):
+        r = arr[i, 1]
+        ni = arr[i, 3]
+        if not np.isnan(r) and r > 0 and not np.isnan(ni):
+            if m_count == 0:
+                first_margin = ni / r
+            last_margin = ni / r
+            m_count += 1
+
+    if m_count >= 2:
+        margin_trend = (last_margin - first_margin) / m_count  # Average annual margin change
+        net_margin = last_margin
+
+    # Normalize and cap growth rates
+    revenue_growth = min(1.0, max(-0.5, revenue_growth))
+    revenue_cagr = min(1.0, max(-0.5, revenue_cagr))
+    ebitda_growth = min(1.0, max(-0.5, ebitda_growth))
+
+    return revenue_growth, revenue_cagr, ebitda_margin, ebitda_growth, net_margin, margin_trend
+
+
+def warm_pairing_kernels() -> None:
+    """Trigger JIT compilation of the growth kernel outside the request path."""
+    _growth_kernel(np.full((2, 4), np.nan))
+
 
 def _calculate_growth_metrics(financials: List[Dict[str, Any]]) -> Dict[str, float]:
     """Calculate comprehensive growth and profitability metrics.
-    
+
     Metrics included:
     - Revenue growth (YoY and CAGR)
     - EBITDA margins and growth
     - Net income margins and growth
-    - Operating cash flow trends
     """
     if len(financials) < 2:
         return {
@@ -136,101 +427,22 @@ def _calculate_growth_metrics(financials: List[Dict[str, Any]]) -> Dict[str, flo
             "net_margin": 0.0,
             "margin_trend": 0.0
         }
-    
-    # Extract time series for each metric
-    metrics = {
-        "revenue": [],
-        "ebitda": [],
-        "net_income": [],
-        "operating_cash_flow": []
-    }
-    
-    for f in financials:
-        data = f.get("data", {}).get("values", {})
-        year = f["year"]
-        
-        if isinstance(data, dict):
-            # Extract revenue
-            for k, v in data.items():
-                if isinstance(k, str):
-                    k_lower = k.lower()
-                    try:
-                        val = float(v)
-                        if "revenue" in k_lower or "sales" in k_lower:
-                            metrics["revenue"].append((year, val))
-                        elif "ebitda" in k_lower:
-                            metrics["ebitda"].append((year, val))
-                        elif "net income" in k_lower:
-                            metrics["net_income"].append((year, val))
-                        elif "operating cash flow" in k_lower:
-                            metrics["operating_cash_flow"].append((year, val))
-                    except (ValueError, TypeError):
-                        continue
-    
-    # Sort all metrics by year
-    for metric in metrics.values():
-        metric.sort(key=lambda x: x[0])
-    
-    results = {}
-    
-    # Calculate revenue metrics
-    if len(metrics["revenue"]) >= 2:
-        latest_rev = metrics["revenue"][-1][1]
-        prev_rev = metrics["revenue"][-2][1]
-        first_rev = metrics["revenue"][0][1]
-        years = metrics["revenue"][-1][0] - metrics["revenue"][0][0]
-        
-        results["revenue_growth"] = ((latest_rev / prev_rev) - 1) if prev_rev > 0 else 0
-        results["revenue_cagr"] = ((latest_rev / first_rev) ** (1/years) - 1) if years > 0 and first_rev > 0 else 0
-    else:
-        results["revenue_growth"] = results["revenue_cagr"] = 0.0
-    
-    # Calculate profitability metrics
-    if metrics["revenue"] and metrics["ebitda"]:
-        latest_rev = metrics["revenue"][-1][1]
-        latest_ebitda = next((v[1] for v in metrics["ebitda"] if v[0] == metrics["revenue"][-1][0]), 0)
-        results["ebitda_margin"] = latest_ebitda / latest_rev if latest_rev > 0 else 0
-        
-        # Calculate EBITDA growth
-        if len(metrics["ebitda"]) >= 2:
-            results["ebitda_growth"] = (metrics["ebitda"][-1][1] / metrics["ebitda"][-2][1] - 1) if metrics["ebitda"][-2][1] > 0 else 0
-        else:
-            results["ebitda_growth"] = 0.0
-    else:
-        results["ebitda_margin"] = results["ebitda_growth"] = 0.0
-    
-    # Calculate margin trend
-    if metrics["revenue"] and metrics["net_income"]:
-        margins = []
-        for year, rev in metrics["revenue"]:
-            ni = next((v[1] for v in metrics["net_income"] if v[0] == year), None)
-            if ni is not None and rev > 0:
-                margins.append(ni / rev)
-        
-        if len(margins) >= 2:
-            results["margin_trend"] = (margins[-1] - margins[0]) / len(margins)  # Average annual margin change
-            results["net_margin"] = margins[-1]
-        else:
-            results["margin_trend"] = results["net_margin"] = 0.0
-    else:
-        results["margin_trend"] = results["net_margin"] = 0.0
-    
-    # Normalize and cap growth rates
-    for key in results:
-        if "growth" in key or "cagr" in key:
-            results[key] = max(-0.5, min(1.0, results[key]))
-            
-    return results
-        
+
+    arr = _normalize_financials(financials)
+    revenue_growth, revenue_cagr, ebitda_margin, ebitda_growth, net_margin, margin_trend = _growth_kernel(arr)
+
     return {
-        "revenue_growth": max(-0.5, min(1.0, yoy_growth)),
-        "cagr": max(-0.5, min(1.0, cagr))
+        "revenue_growth": revenue_growth,
+        "revenue_cagr": revenue_cagr,
+        "ebitda_margin": ebitda_margin,
+        "ebitda_growth": ebitda_growth,
+        "net_margin": net_margin,
+        "margin_trend": margin_trend
     }
 
 def _growth_score_from_financials(session: Session, company: Company) -> float:
     """Calculate a comprehensive growth score using multiple metrics."""
     try:
-        rows = session.query(Company).filter(Company.id == company.id).first()
         # we didn't eager-load financials in many contexts; try to use relationship
         fin_rows = company.financials
         if not fin_rows:
@@ -260,56 +472,121 @@ def _growth_score_from_financials(session: Session, company: Company) -> float:
         return 0.0
 
 
-def score_pair(acquirer: Company, target: Company, session: Session) -> Tuple[float, Dict[str, float]]:
-    """Compute total compatibility score (0..100) and return sub-scores."""
-    acq_cap = acquirer.market_cap or 0.0
-    tgt_cap = target.market_cap or 0.0
+# Growth metrics per company survive across acquirers: scoring many
+# acquirers back-to-back re-reads the same targets, so the normalized
+# scan + kernel run once per company per hour instead of once per pair.
+# Worker processes keep their own copy, which is still a win within a
+# pool's lifetime.
+_growth_metrics_cache: TTLCache = TTLCache(maxsize=5000, ttl=3600)
+_growth_metrics_cache_lock = threading.Lock()
+
+
+def _growth_metrics_for(company_id: Optional[str], financials: List[Dict[str, Any]]) -> Dict[str, float]:
+    """_calculate_growth_metrics memoized by company id (skips the cache
+    when no id is available)."""
+    if company_id is not None:
+        with _growth_metrics_cache_lock:
+            hit = _growth_metrics_cache.get(company_id)
+        if hit is not None:
+            return hit
+    metrics = _calculate_growth_metrics(financials)
+    if company_id is not None:
+        with _growth_metrics_cache_lock:
+            _growth_metrics_cache[company_id] = metrics
+    return metrics
+
+
+def _score_pair_pure(
+    acq_cap: float,
+    tgt_cap: float,
+    size: float,
+    sector: float,
+    tgt_financials: List[Dict[str, Any]],
+    tgt_id: Optional[str] = None,
+) -> Tuple[float, Dict[str, float]]:
+    """The scoring math over plain picklable data — no ORM objects or
+    sessions — so it can run unchanged in worker processes.
+    """
+    tgt_growth_metrics = _growth_metrics_for(tgt_id, tgt_financials)
 
-    # Calculate basic scores
-    size = _size_score(acq_cap, tgt_cap)
-    sector = _sector_score(acquirer.sector or "", target.sector or "")
-    
-    # Get growth metrics for both companies
-    acq_financials = _get_cached_financials(str(acquirer.id))
-    tgt_financials = _get_cached_financials(str(target.id))
-    
-    acq_growth_metrics = _calculate_growth_metrics(acq_financials)
-    tgt_growth_metrics = _calculate_growth_metrics(tgt_financials)
-    
     # Calculate growth synergy score
-    growth_synergy = max(0, min(1, 
-        0.7 * tgt_growth_metrics["cagr"] +  # Higher weight on long-term growth
+    growth_synergy = max(0, min(1,
+        0.7 * tgt_growth_metrics["revenue_cagr"] +  # Higher weight on long-term growth
         0.3 * tgt_growth_metrics["revenue_growth"]  # Some weight on recent growth
     ))
-    
+
     # Calculate market position score
     relative_size = tgt_cap / acq_cap if acq_cap > 0 else 0
-    market_position = max(0, min(1, 
+    market_position = max(0, min(1,
         1 - abs(0.3 - relative_size)  # Optimal target size is 30% of acquirer
     ))
-    
+
     # Weights (tweakable)
     w_size = 0.4
     w_sector = 0.25
     w_growth = 0.2
     w_market = 0.15
-    
-    total = (w_size * size + 
-             w_sector * sector + 
+
+    total = (w_size * size +
+             w_sector * sector +
              w_growth * growth_synergy +
              w_market * market_position)
-             
+
     return float(total * 100.0), {
         "size": size,
         "sector": sector,
         "growth_synergy": growth_synergy,
         "market_position": market_position,
-        "target_cagr": tgt_growth_metrics["cagr"],
+        "target_cagr": tgt_growth_metrics["revenue_cagr"],
         "target_recent_growth": tgt_growth_metrics["revenue_growth"]
     }
 
-    total = w_size * size + w_sector * sector + w_growth * growth
-    return float(total * 100.0), {"size": size, "sector": sector, "growth": growth}
+
+def _growth_metrics_chunk(items: List[Tuple[str, List[Dict[str, Any]]]]) -> List[Dict[str, float]]:
+    """Growth metrics for a batch of (company_id, financials) pairs.
+
+    Chunking amortizes the pickle/IPC round-trip when farming work out to
+    a process pool.
+    """
+    return [_growth_metrics_for(cid, fin) for cid, fin in items]
+
+
+# Below this many candidates, pool spin-up costs more than it saves
+_SERIAL_SCORING_THRESHOLD = 50
+_SCORING_CHUNK = 256
+
+
+def score_pair(
+    acquirer: Company,
+    target: Company,
+    session: Session,
+    financials_map: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    size: Optional[float] = None,
+    sector: Optional[float] = None,
+) -> Tuple[float, Dict[str, float]]:
+    """Compute total compatibility score (0..100) and return sub-scores.
+
+    Pass `financials_map` (from _prefetch_financials) when scoring many
+    candidates so each pair doesn't trigger its own financials query.
+    Batch callers that have already run the vectorized _size_scores /
+    _sector_scores pass the precomputed values via `size` / `sector`.
+    """
+    acq_cap = acquirer.market_cap or 0.0
+    tgt_cap = target.market_cap or 0.0
+
+    # Calculate basic scores
+    if size is None:
+        size = _size_score(acq_cap, tgt_cap)
+    if sector is None:
+        sector = _sector_score(acquirer.sector or "", target.sector or "")
+
+    tgt_id = str(target.id)
+    if financials_map is not None:
+        tgt_financials = financials_map.get(tgt_id, [])
+    else:
+        tgt_financials = _get_cached_financials(tgt_id, session)
+
+    return _score_pair_pure(acq_cap, tgt_cap, size, sector, tgt_financials, tgt_id)
 
 
 def generate_top_pairs(acquirer_ticker: str, top: int = 20) -> List[Dict[str, Any]]:
@@ -323,36 +600,133 @@ def generate_top_pairs(acquirer_ticker: str, top: int = 20) -> List[Dict[str, An
         if not acquirer:
             raise ValueError(f"Acquirer ticker {acquirer_ticker} not found")
 
-        candidates = session.query(Company).filter(Company.id != acquirer.id).all()
-        scored = []
-        for tgt in candidates:
-            score, subs = score_pair(acquirer, tgt, session)
-            scored.append((tgt, score, subs))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
-        top_items = scored[:top]
-
-        results = []
-        for tgt, score, subs in top_items:
-            # upsert DealPair record
-            pair = session.query(DealPair).filter(DealPair.acquirer_id == acquirer.id, DealPair.target_id == tgt.id).first()
-            if not pair:
-                pair = DealPair(acquirer_id=acquirer.id, target_id=tgt.id, compatibility_score=score, metadata_json=subs)
-                session.add(pair)
+        # Struct-of-arrays candidate layout: one sequential pass over the
+        # column query fills parallel arrays, and every later stage works
+        # on contiguous data instead of chasing per-row tuples
+        ids_l, tickers_l, names_l, sectors_l, caps_l = [], [], [], [], []
+        for row in session.query(*_CANDIDATE_COLS).filter(Company.id != acquirer.id).yield_per(1000):
+            ids_l.append(row.id)
+            tickers_l.append(row.ticker)
+            names_l.append(row.name)
+            sectors_l.append(row.sector)
+            caps_l.append(row.market_cap or 0.0)
+        ids = np.array(ids_l, dtype=object)
+        tickers = np.array(tickers_l, dtype=object)
+        names = np.array(names_l, dtype=object)
+        sectors = np.array(sectors_l, dtype=object)
+        caps = np.array(caps_l, dtype=np.float64)
+
+        # Candidates outside the 5%-70% cap-ratio band score zero on size
+        # anyway; drop them here so they skip sector scoring, the
+        # financials prefetch, and growth metrics entirely
+        acq_cap = acquirer.market_cap or 0.0
+        if acq_cap > 0:
+            mask = (caps >= 0.05 * acq_cap) & (caps <= 0.70 * acq_cap)
+            ids, tickers, names, sectors, caps = (
+                ids[mask], tickers[mask], names[mask], sectors[mask], caps[mask]
+            )
+
+        # Stringify each UUID once up front; the financials map is keyed by
+        # string and re-running str() per candidate in the hot loop just
+        # re-allocates the same keys
+        id_strs = [str(cid) for cid in ids]
+
+        # One batched financials load for the acquirer + every surviving
+        # candidate
+        financials_map = _prefetch_financials(session, [acquirer.id] + list(ids))
+
+        # Size and sector sub-scores are data-parallel across candidates:
+        # one vectorized pass each instead of per-pair Python calls
+        size_arr = _size_scores(acq_cap, caps)
+        sector_arr = _sector_scores(acquirer.sector, list(sectors))
+
+        # Growth metrics are the only per-candidate Python work left, so
+        # that's what goes to the worker processes; small universes stay
+        # serial to skip pool spin-up
+        work = [(id_strs[i], financials_map.get(id_strs[i], [])) for i in range(len(ids))]
+        if len(work) < _SERIAL_SCORING_THRESHOLD:
+            metrics_list = _growth_metrics_chunk(work)
+        else:
+            chunks = [work[i:i + _SCORING_CHUNK] for i in range(0, len(work), _SCORING_CHUNK)]
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                metrics_list = [m for batch in pool.map(_growth_metrics_chunk, chunks) for m in batch]
+
+        # From here on the whole universe is scored with a handful of
+        # vector ops — same formulas as _score_pair_pure, applied to arrays
+        n = len(metrics_list)
+        cagrs = np.fromiter((m["revenue_cagr"] for m in metrics_list), dtype=np.float64, count=n)
+        rgs = np.fromiter((m["revenue_growth"] for m in metrics_list), dtype=np.float64, count=n)
+        growth_syn = np.clip(0.7 * cagrs + 0.3 * rgs, 0.0, 1.0)
+        rel_size = caps / acq_cap if acq_cap > 0 else np.zeros(n, dtype=np.float64)
+        market_pos = np.clip(1.0 - np.abs(0.3 - rel_size), 0.0, 1.0)
+        scores = 100.0 * (
+            0.4 * size_arr + 0.25 * sector_arr + 0.2 * growth_syn + 0.15 * market_pos
+        )
+
+        # O(N) partition to find the top-K, then sort only those K —
+        # a full sort of the universe just to keep 20 rows is wasted work
+        if scores.shape[0] > top:
+            part = np.argpartition(scores, -top)[-top:]
+            top_idx = part[np.argsort(-scores[part], kind="stable")]
+        else:
+            top_idx = np.argsort(-scores, kind="stable")
+
+        # Sub-score dicts only exist for the rows that get persisted
+        top_items = [
+            (
+                int(i),
+                float(scores[i]),
+                {
+                    "size": float(size_arr[i]),
+                    "sector": float(sector_arr[i]),
+                    "growth_synergy": float(growth_syn[i]),
+                    "market_position": float(market_pos[i]),
+                    "target_cagr": metrics_list[i]["revenue_cagr"],
+                    "target_recent_growth": metrics_list[i]["revenue_growth"],
+                },
+            )
+            for i in top_idx
+        ]
+
+        # Upsert all DealPair records in one statement + one commit; the
+        # per-item SELECT/INSERT-or-UPDATE/commit sequence cost up to three
+        # round-trips and an fsync per pair
+        if top_items:
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "acquirer_id": acquirer.id,
+                    "target_id": ids[i],
+                    "compatibility_score": score,
+                    "metadata_json": subs,
+                }
+                for i, score, subs in top_items
+            ]
+            if session.get_bind().dialect.name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
             else:
-                pair.compatibility_score = score
-                pair.metadata_json = subs
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            stmt = dialect_insert(DealPair).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["acquirer_id", "target_id"],
+                set_={
+                    "compatibility_score": stmt.excluded.compatibility_score,
+                    "metadata_json": stmt.excluded.metadata_json,
+                },
+            )
+            session.execute(stmt)
             session.commit()
 
-            results.append({
+        return [
+            {
                 "acquirer": acquirer.ticker,
-                "target": tgt.ticker,
-                "target_name": tgt.name,
+                "target": tickers[i],
+                "target_name": names[i],
                 "score": score,
                 "subscores": subs,
-                "target_market_cap": tgt.market_cap,
-            })
-
-        return results
+                "target_market_cap": float(caps[i]),
+            }
+            for i, score, subs in top_items
+        ]
     finally:
         session.close()
@@ -0,0 +1,100 @@
+"""HTML-based deal brief renderer, selectable via PDF_ENGINE=html.
+
+The brief is mostly headings and tables, which map directly onto
+HTML+CSS. The template here is a module constant filled per brief, so
+all the layout cost lives in the HTML-to-PDF backend rather than in
+Python-side flowable construction. WeasyPrint is preferred, xhtml2pdf
+is the fallback; neither is a hard dependency — when both are missing,
+html_renderer_available() is False and backend.pdf_generator keeps
+using ReportLab regardless of the flag.
+"""
+from io import BytesIO
+from typing import Any, Dict
+
+try:
+    import weasyprint
+    _HTML_BACKEND = "weasyprint"
+except ImportError:
+    try:
+        from xhtml2pdf import pisa
+        _HTML_BACKEND = "xhtml2pdf"
+    except ImportError:
+        _HTML_BACKEND = None
+
+
+def html_renderer_available() -> bool:
+    """True when an HTML-to-PDF backend is importable."""
+    return _HTML_BACKEND is not None
+
+
+_BRIEF_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<style>
+  body {{ font-family: Helvetica, Arial, sans-serif; color: #2c3e50; }}
+  h1 {{ font-size: 24px; color: #1a1a2e; text-align: center; }}
+  h2 {{ font-size: 16px; color: #16213e; margin-top: 24px; }}
+  p.meta {{ font-size: 12px; color: #666666; text-align: center; }}
+  table {{ border-collapse: collapse; width: 100%; }}
+  th, td {{ border: 0.5px solid #dee2e6; padding: 8px; font-size: 10px;
+            text-align: left; }}
+  th {{ background-color: #f8f9fa; }}
+  ul {{ font-size: 10px; line-height: 1.5; }}
+</style>
+</head>
+<body>
+<h1>M&amp;A Deal Brief: {acquirer} &rarr; {target}</h1>
+<p class="meta">Generated on {generated_on}</p>
+<h2>Deal Summary</h2>
+<table>
+  <tr><th>Metric</th><th>Value</th></tr>
+  <tr><td>Enterprise Value</td><td>{enterprise_value}</td></tr>
+  <tr><td>Revenue Multiple</td><td>{revenue_multiple:.1f}x</td></tr>
+  <tr><td>EBITDA Multiple</td><td>{ebitda_multiple:.1f}x</td></tr>
+  <tr><td>Deal Confidence</td><td>{confidence}</td></tr>
+</table>
+<h2>Strategic Rationale</h2>
+<ul>
+  <li>Market Position: Strengthening competitive position through
+      complementary capabilities</li>
+  <li>Growth Synergies: Revenue expansion through cross-selling and
+      market access</li>
+  <li>Cost Synergies: Operational efficiencies and scale economies</li>
+  <li>Technology &amp; Innovation: Enhanced R&amp;D capabilities and
+      digital transformation</li>
+</ul>
+</body>
+</html>"""
+
+
+def generate_deal_brief_html_bytes(deal_data: Dict[str, Any]) -> bytes:
+    """Render the deal brief through the HTML pipeline and return PDF bytes.
+
+    Raises RuntimeError when no HTML-to-PDF backend is installed; callers
+    should check html_renderer_available() first.
+    """
+    if _HTML_BACKEND is None:
+        raise RuntimeError(
+            "PDF_ENGINE=html requires weasyprint or xhtml2pdf to be installed"
+        )
+
+    # Imported here, not at the top, to avoid a circular import with
+    # backend.pdf_generator's PDF_ENGINE dispatch
+    from backend.pdf_generator import format_currency, _format_percent, _today_str
+
+    html = _BRIEF_TEMPLATE.format(
+        acquirer=deal_data.get('acquirer', 'Acquirer'),
+        target=deal_data.get('target', 'Target'),
+        generated_on=_today_str(),
+        enterprise_value=format_currency(deal_data.get('enterprise_value', 0)),
+        revenue_multiple=deal_data.get('revenue_multiple', 0),
+        ebitda_multiple=deal_data.get('ebitda_multiple', 0),
+        confidence=_format_percent(deal_data.get('confidence', 0)),
+    )
+
+    buffer = BytesIO()
+    if _HTML_BACKEND == "weasyprint":
+        weasyprint.HTML(string=html).write_pdf(buffer)
+    else:
+        pisa.CreatePDF(html, dest=buffer)
+    return buffer.getvalue()
@@ -1,10 +1,12 @@
 """Integration tests for the M&A analysis platform."""
 import unittest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.pool import StaticPool
 import os
 import sys
 import pytest
+import requests
 from datetime import datetime
 
 # Add parent directory to path to import modules
@@ -12,6 +14,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.db import Base
 from backend.models.models import Company, Financial, DealPair, Valuation
+from backend import metrics
 from backend.metrics import calculate_wacc, calculate_growth_rates
 from backend.valuation import (
     calculate_base_fcf,
@@ -19,27 +22,39 @@ from backend.valuation import (
     calculate_dcf_confidence
 )
 
-# Use SQLite for testing
-TEST_DB_URL = "sqlite:///./test_ma_deals.db"
+# In-memory SQLite: no on-disk database to fsync or clean up. StaticPool
+# keeps the single shared connection (a :memory: db per connection otherwise)
+TEST_DB_URL = "sqlite:///:memory:"
 
 class TestMAAnalysis(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Create test database
-        cls.engine = create_engine(TEST_DB_URL)
+        cls.engine = create_engine(
+            TEST_DB_URL,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
         Base.metadata.create_all(cls.engine)
-        
+
         # Create session
         Session = sessionmaker(bind=cls.engine)
         cls.session = Session()
-        
+
         # Create test data
         cls.setup_test_data()
-    
+
+        # Pre-seed the market-data cache so calculate_wacc never goes out
+        # to Yahoo from the test suite
+        with metrics._market_data_cache_lock:
+            metrics._market_data_cache[("SPOT", "5y")] = {"beta": 1.2}
+
     @classmethod
     def tearDownClass(cls):
+        with metrics._market_data_cache_lock:
+            metrics._market_data_cache.pop(("SPOT", "5y"), None)
         cls.session.close()
-        os.remove("./test_ma_deals.db")
+        cls.engine.dispose()
     
     @classmethod
     def setup_test_data(cls):
@@ -61,18 +76,27 @@ class TestMAAnalysis(unittest.TestCase):
         cls.session.add(acquirer)
         cls.session.add(target)
         
-        # Add financial data
+        # Add financial data, shaped the way ingest persists it: statement
+        # values under data["values"], hot scalars promoted to typed columns
         financials = [
             Financial(
                 company=target,
                 statement_type="income",
                 period="annual",
                 year=2022,
+                revenue=10000000000.0,
+                ebitda=1100000000.0,
                 data={
-                    "revenue": 10000000000,
-                    "operating_income": 1000000000,
-                    "depreciation": 100000000,
-                    "ebitda": 1100000000
+                    "values": {
+                        "Revenue": 10000000000,
+                        "Operating Income": 1000000000,
+                        "Depreciation & Amortization": 100000000,
+                        "Capital Expenditure": -500000000,
+                        "Change in Working Capital": 50000000,
+                        "Net Income": 800000000,
+                        "Operating Cash Flow": 1200000000,
+                        "EBITDA": 1100000000
+                    }
                 }
             ),
             Financial(
@@ -80,11 +104,19 @@ class TestMAAnalysis(unittest.TestCase):
                 statement_type="income",
                 period="annual",
                 year=2021,
+                revenue=8000000000.0,
+                ebitda=880000000.0,
                 data={
-                    "revenue": 8000000000,
-                    "operating_income": 800000000,
-                    "depreciation": 80000000,
-                    "ebitda": 880000000
+                    "values": {
+                        "Revenue": 8000000000,
+                        "Operating Income": 800000000,
+                        "Depreciation & Amortization": 80000000,
+                        "Capital Expenditure": -400000000,
+                        "Change in Working Capital": 40000000,
+                        "Net Income": 640000000,
+                        "Operating Cash Flow": 960000000,
+                        "EBITDA": 880000000
+                    }
                 }
             )
         ]
@@ -100,31 +132,47 @@ class TestMAAnalysis(unittest.TestCase):
         
         cls.session.add(pair)
         cls.session.commit()
-        
-        # Store references
-        cls.acquirer = acquirer
-        cls.target = target
-        cls.pair = pair
-        cls.financials = financials
+
+        # Re-query the full graph eagerly so test methods never trigger
+        # per-attribute lazy loads against the shared session
+        cls.pair = (
+            cls.session.query(DealPair)
+            .options(
+                selectinload(DealPair.acquirer),
+                selectinload(DealPair.target).selectinload(Company.financials),
+            )
+            .one()
+        )
+        cls.acquirer = cls.pair.acquirer
+        cls.target = cls.pair.target
+        cls.financials = sorted(
+            cls.target.financials, key=lambda f: f.year, reverse=True
+        )
     
     def test_dcf_valuation(self):
         """Test DCF valuation calculation."""
         # Calculate base FCF
-        base_fcf = calculate_base_fcf(self.financials)
-        self.assertGreater(base_fcf, 0)
-        
+        base_metrics = calculate_base_fcf(self.financials)
+        self.assertGreater(base_metrics["base_fcf"], 0)
+
         # Test cash flow projection
         growth_rate = 0.05
         years = 5
-        fcfs = project_cash_flows(base_fcf, growth_rate, years)
+        projection = project_cash_flows(base_metrics, growth_rate, years)
+        fcfs = projection["projected_fcfs"]
         self.assertEqual(len(fcfs), years)
         self.assertGreater(fcfs[-1], fcfs[0])
-        
+
         # Test confidence calculation
         confidence = calculate_dcf_confidence(self.financials, growth_rate, 0.1)
-        self.assertGreaterEqual(confidence, 0)
-        self.assertLessEqual(confidence, 1)
-    
+        self.assertGreater(confidence["overall_confidence"], 0)
+        self.assertLessEqual(confidence["overall_confidence"], 1)
+
+    def test_market_data_session(self):
+        """yfinance must get a plain requests.Session (>= 0.2.44 rejects
+        requests-cache sessions, which silently empties every market fetch)."""
+        self.assertIs(type(metrics.yf_session), requests.Session)
+
     def test_metrics_calculation(self):
         """Test financial metrics calculations."""
         # Test WACC calculation
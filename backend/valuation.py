@@ -6,13 +6,199 @@ from typing import List, Dict, Any, Optional
 import numpy as np
 from datetime import datetime
 import logging
+import threading
+from cachetools import TTLCache
 from .models.models import Financial
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
 logger = logging.getLogger(__name__)
 
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _base_fcf_kernel(revenue, ebit, depreciation, capex, nwc_change):
+    """Numeric core of calculate_base_fcf over parallel float64 arrays.
+
+    Returns (base_fcf, ebit_margin, capex_ratio, fcf_margin, stability_score).
+    """
+    n = revenue.shape[0]
+    fcfs = np.empty(n)
+    total_rev = 0.0
+    total_ebit = 0.0
+    total_fcf = 0.0
+    total_capex = 0.0
+    count = 0
+    for i in range(n):
+        if revenue[i] > 0:  # Only include years with valid revenue
+            year_fcf = ebit[i] * (1 - 0.25)  # Apply standard tax rate
+            year_fcf += depreciation[i]      # Add back non-cash charges
+            year_fcf -= capex[i]             # Subtract CapEx
+            year_fcf -= nwc_change[i]        # Adjust for working capital
+            fcfs[count] = year_fcf
+            total_rev += revenue[i]
+            total_ebit += ebit[i]
+            total_fcf += year_fcf
+            total_capex += capex[i]
+            count += 1
+
+    if count == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+
+    avg_rev = total_rev / count
+    avg_ebit = total_ebit / count
+    avg_fcf = total_fcf / count
+    avg_capex = total_capex / count
+
+    ebit_margin = avg_ebit / avg_rev if avg_rev > 0 else 0.0
+    capex_ratio = avg_capex / avg_rev if avg_rev > 0 else 0.0
+    fcf_margin = avg_fcf / avg_rev if avg_rev > 0 else 0.0
+
+    if count > 1 and avg_fcf > 0:
+        var = 0.0
+        for i in range(count):
+            var += (fcfs[i] - avg_fcf) ** 2
+        fcf_std = (var / count) ** 0.5
+        stability_score = 1.0 - min(1.0, fcf_std / abs(avg_fcf))
+    else:
+        stability_score = 0.0
+
+    return max(0.0, avg_fcf), ebit_margin, capex_ratio, fcf_margin, stability_score
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _projection_kernel(base_fcf, effective_growth, ebit_margin, margin_expansion, capex_ratio, years):
+    """Numeric core of project_cash_flows: the FCF growth recurrence."""
+    fcfs = np.empty(years)
+    margins = np.empty(years)
+    capex = np.empty(years)
+    for year in range(1, years + 1):
+        year_growth = effective_growth * (1 - 0.02 * year)  # Slight decay in growth rate
+        fcf_before_margin = base_fcf * (1 + year_growth) ** year
+        year_margin = ebit_margin + margin_expansion * min(year, 3)
+        if year <= 2:
+            year_capex = capex_ratio * 1.2  # 20% higher capex in early years
+        else:
+            year_capex = capex_ratio
+        final_fcf = fcf_before_margin * (1 + (year_margin - ebit_margin))
+        final_fcf = final_fcf * (1 - (year_capex - capex_ratio))
+        fcfs[year - 1] = max(0.0, final_fcf)
+        margins[year - 1] = year_margin
+        capex[year - 1] = year_capex
+    return fcfs, margins, capex
+
+
+def warm_valuation_kernels() -> None:
+    """Trigger JIT compilation of the numeric kernels outside the request path."""
+    one = np.ones(1)
+    _base_fcf_kernel(one, one, one, one, one)
+    _projection_kernel(1.0, 0.03, 0.10, 0.01, 0.05, 1)
+
+
+def _values_of(fin) -> Dict[str, Any]:
+    """Resolve a record's "values" sub-dict.
+
+    ORM Financial instances cache the lookup (Financial.values_dict);
+    column-projection rows from the API queries fall back to the plain
+    dict traversal.
+    """
+    cached = getattr(fin, "values_dict", None)
+    if cached is not None:
+        return cached
+    data = fin.data
+    return data.get("values", {}) if isinstance(data, dict) else {}
+
+
+def _coerce_float(value) -> float:
+    """Coerce a metric value to float, treating junk as missing (0.0)."""
+    if type(value) is float:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _F:
+    """Column indices of the per-record metric matrix."""
+    REVENUE = 0
+    OP_INC = 1
+    DA = 2
+    CAPEX = 3
+    NWC = 4
+
+
+# Metric matrices keyed by the persisted Financial ids; one dict walk per
+# record set instead of one per helper per call
+_metric_matrix_cache: TTLCache = TTLCache(maxsize=2000, ttl=3600)
+_metric_matrix_cache_lock = threading.Lock()
+
+
+def _metric_matrix(financials: List[Financial]) -> np.ndarray:
+    """Build (and cache) the (n, 5) float64 metric matrix for a record set.
+
+    Columns follow _F: (revenue, operating income, D&A, |capex|, ΔNWC).
+    Persisted record sets are cached on their id tuple, so the confidence
+    and sensitivity paths pay the dict traversal once per TTL window.
+    """
+    cache_key = None
+    if all(getattr(fin, "id", None) is not None for fin in financials):
+        cache_key = tuple(fin.id for fin in financials)
+        with _metric_matrix_cache_lock:
+            cached = _metric_matrix_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    rows = []
+    for fin in financials:
+        values = _values_of(fin)
+        rows.append([
+            _coerce_float(values.get("Revenue", 0)),
+            _coerce_float(values.get("Operating Income", 0)),
+            _coerce_float(values.get("Depreciation & Amortization", 0)),
+            _coerce_float(values.get("Capital Expenditure", 0)),
+            _coerce_float(values.get("Change in Working Capital", 0)),
+        ])
+    matrix = np.asarray(rows, dtype=np.float64).reshape(len(rows), 5)
+    matrix[:, _F.CAPEX] = np.abs(matrix[:, _F.CAPEX])  # CapEx reported as an outflow
+    matrix.setflags(write=False)  # shared across callers via the cache
+
+    if cache_key is not None:
+        with _metric_matrix_cache_lock:
+            _metric_matrix_cache[cache_key] = matrix
+    return matrix
+
+
+def _financial_metric_arrays(financials: List[Financial]):
+    """Column views of the metric matrix as parallel float64 arrays."""
+    matrix = _metric_matrix(financials)
+    return (
+        np.ascontiguousarray(matrix[:, _F.REVENUE]),
+        np.ascontiguousarray(matrix[:, _F.OP_INC]),
+        np.ascontiguousarray(matrix[:, _F.DA]),
+        np.ascontiguousarray(matrix[:, _F.CAPEX]),
+        np.ascontiguousarray(matrix[:, _F.NWC]),
+    )
+
+# Base-FCF results keyed by the persisted Financial ids; DCF confidence and
+# sensitivity paths recompute over the same records many times per request
+_base_fcf_cache: TTLCache = TTLCache(maxsize=2000, ttl=3600)
+_base_fcf_cache_lock = threading.Lock()
+
+
 def calculate_base_fcf(financials: List[Financial]) -> Dict[str, float]:
     """Calculate normalized base free cash flow and supporting metrics.
-    
+
     Returns:
         Dict containing:
         - base_fcf: Normalized free cash flow
@@ -29,77 +215,38 @@ def calculate_base_fcf(financials: List[Financial]) -> Dict[str, float]:
             "fcf_margin": 0.0,
             "stability_score": 0.0
         }
-    
-    try:
-        # Get last 3 years of data if available
-        years_data = []
-        for fin in financials[:3]:  # Most recent 3 years
-            data = fin.data.get("values", {})
-            
-            revenue = float(data.get("Revenue", 0))
-            ebit = float(data.get("Operating Income", 0))
-            depreciation = float(data.get("Depreciation & Amortization", 0))
-            capex = abs(float(data.get("Capital Expenditure", 0)))  # Make positive
-            nwc_change = float(data.get("Change in Working Capital", 0))
-            
-            if revenue > 0:  # Only include years with valid revenue
-                year_fcf = ebit * (1 - 0.25)  # Apply standard tax rate
-                year_fcf += depreciation  # Add back non-cash charges
-                year_fcf -= capex  # Subtract CapEx
-                year_fcf -= nwc_change  # Adjust for working capital
-                
-                years_data.append({
-                    "revenue": revenue,
-                    "ebit": ebit,
-                    "fcf": year_fcf,
-                    "capex": capex
-                })
-        
-        if not years_data:
-            return {
-                "base_fcf": 0.0,
-                "ebit_margin": 0.0,
-                "capex_ratio": 0.0,
-                "fcf_margin": 0.0,
-                "stability_score": 0.0
-            }
-            
-        # Calculate normalized metrics
-        avg_revenue = sum(y["revenue"] for y in years_data) / len(years_data)
-        avg_ebit = sum(y["ebit"] for y in years_data) / len(years_data)
-        avg_fcf = sum(y["fcf"] for y in years_data) / len(years_data)
-        avg_capex = sum(y["capex"] for y in years_data) / len(years_data)
-        
-        # Calculate margins and ratios
-        ebit_margin = avg_ebit / avg_revenue if avg_revenue > 0 else 0
-        capex_ratio = avg_capex / avg_revenue if avg_revenue > 0 else 0
-        fcf_margin = avg_fcf / avg_revenue if avg_revenue > 0 else 0
-        
-        # Calculate FCF stability score (0-1)
-        fcf_values = [y["fcf"] for y in years_data]
-        if len(fcf_values) > 1 and avg_fcf > 0:
-            fcf_std = np.std(fcf_values)
-            stability_score = 1.0 - min(1.0, fcf_std / abs(avg_fcf))
-        else:
-            stability_score = 0.0
-            
-        return {
-            "base_fcf": max(0.0, avg_fcf),  # Floor at zero
-            "ebit_margin": ebit_margin,
-            "capex_ratio": capex_ratio,
-            "fcf_margin": fcf_margin,
-            "stability_score": stability_score
-        }
-        
-    except Exception as e:
-        logger.error(f"FCF calculation failed: {e}")
-        return {
-            "base_fcf": 0.0,
-            "ebit_margin": 0.0,
-            "capex_ratio": 0.0,
-            "fcf_margin": 0.0,
-            "stability_score": 0.0
-        }
+
+    # Only persisted records have stable ids to key on; unsaved objects
+    # and id-less column projections just compute directly
+    recent = financials[:3]
+    cache_key = None
+    if all(getattr(fin, "id", None) is not None for fin in recent):
+        cache_key = tuple(fin.id for fin in recent)
+        with _base_fcf_cache_lock:
+            cached = _base_fcf_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+    # Extract last 3 years into parallel float64 arrays for the JIT kernel;
+    # malformed values coerce to 0.0 during extraction, so a bad record
+    # drops out via the revenue mask instead of discarding the whole batch
+    revenue, ebit, depreciation, capex, nwc_change = _financial_metric_arrays(recent)
+
+    base_fcf, ebit_margin, capex_ratio, fcf_margin, stability_score = _base_fcf_kernel(
+        revenue, ebit, depreciation, capex, nwc_change
+    )
+
+    result = {
+        "base_fcf": base_fcf,  # Floor at zero (applied in kernel)
+        "ebit_margin": ebit_margin,
+        "capex_ratio": capex_ratio,
+        "fcf_margin": fcf_margin,
+        "stability_score": stability_score
+    }
+    if cache_key is not None:
+        with _base_fcf_cache_lock:
+            _base_fcf_cache[cache_key] = result
+    return dict(result)
 
 def project_cash_flows(
     base_metrics: Dict[str, float],
@@ -134,35 +281,13 @@ def project_cash_flows(
     else:
         margin_expansion = 0
         
-    # Project FCFs with margin evolution
-    fcfs = []
-    margins = []
-    capex = []
-    
-    for year in range(1, years + 1):
-        # Calculate year's FCF with compounding growth
-        year_growth = effective_growth * (1 - 0.02 * year)  # Slight decay in growth rate
-        
-        # Base FCF grows with effective growth rate
-        fcf_before_margin = base_fcf * (1 + year_growth) ** year
-        
-        # Apply margin evolution
-        year_margin = ebit_margin + margin_expansion * min(year, 3)  # Margin expansion phases in
-        margins.append(year_margin)
-        
-        # Model capex cycles (higher in years 1-2, normalized later)
-        if year <= 2:
-            year_capex = capex_ratio * 1.2  # 20% higher capex in early years
-        else:
-            year_capex = capex_ratio
-        capex.append(year_capex)
-        
-        # Final FCF incorporates margin and capex effects
-        final_fcf = fcf_before_margin * (1 + (year_margin - ebit_margin))
-        final_fcf = final_fcf * (1 - (year_capex - capex_ratio))  # Adjust for capex cycle
-        
-        fcfs.append(max(0.0, final_fcf))  # Floor at zero
-    
+    # Project FCFs with margin evolution (JIT-compiled recurrence)
+    fcfs, margins, capex = _projection_kernel(
+        base_fcf, effective_growth, ebit_margin, margin_expansion, capex_ratio, years
+    )
+
+    # Arrays stay ndarrays end-to-end; callers call .tolist() only at the
+    # JSON-serialization boundary
     return {
         "projected_fcfs": fcfs,
         "margin_trends": margins,
@@ -174,48 +299,59 @@ def project_cash_flows(
         }
     }
 
+def _stdev(values: List[float]) -> float:
+    """Population standard deviation in closed form.
+
+    NumPy's std pays array-construction and dispatch overhead that
+    swamps the arithmetic on the 2-5 element inputs seen here; the
+    scalar formula is faster until inputs reach dozens of elements.
+    """
+    n = len(values)
+    if n <= 1:
+        return 0.0
+    mean = sum(values) / n
+    return (sum((v - mean) * (v - mean) for v in values) / n) ** 0.5
+
+
+def _margin_stability_from_arrays(revenues: np.ndarray, op_incomes: np.ndarray) -> float:
+    """Margin stability from pre-extracted revenue/operating-income columns."""
+    mask = revenues > 0
+    if int(mask.sum()) >= 2:
+        margins = (op_incomes[mask] / revenues[mask]).tolist()
+        mean_margin = sum(margins) / len(margins)
+        if mean_margin != 0:
+            return 1.0 - min(1.0, _stdev(margins) / abs(mean_margin))
+    return 0.0
+
+
 def _calculate_margin_stability(financials: List[Financial]) -> float:
     """Calculate stability of profit margins over time."""
-    try:
-        margins = []
-        for fin in financials:
-            data = fin.data.get("values", {})
-            revenue = float(data.get("Revenue", 0))
-            operating_income = float(data.get("Operating Income", 0))
-            
-            if revenue > 0:
-                margins.append(operating_income / revenue)
-        
-        if len(margins) >= 2:
-            margin_std = np.std(margins)
-            mean_margin = np.mean(margins)
-            if mean_margin != 0:
-                return 1.0 - min(1.0, margin_std / abs(mean_margin))
-    except Exception as e:
-        logger.error(f"Margin stability calculation failed: {e}")
-    
+    revenues, op_incomes, _, _, _ = _financial_metric_arrays(financials)
+    return _margin_stability_from_arrays(revenues, op_incomes)
+
+def _historical_growth_from_arrays(years: np.ndarray, revenues: np.ndarray) -> float:
+    """Revenue CAGR from pre-extracted year/revenue columns."""
+    mask = revenues > 0
+    if int(mask.sum()) >= 2:
+        yrs = years[mask]
+        revs = revenues[mask]
+        order = np.lexsort((revs, yrs))
+        span = yrs[order[-1]] - yrs[order[0]]
+        if span > 0:
+            cagr = (revs[order[-1]] / revs[order[0]]) ** (1.0 / span) - 1.0
+            return float(max(-0.5, min(1.0, cagr)))  # Cap between -50% and 100%
     return 0.0
 
+
 def _calculate_historical_growth(financials: List[Financial]) -> float:
     """Calculate historical revenue growth rate."""
-    try:
-        revenues = []
-        for fin in financials:
-            data = fin.data.get("values", {})
-            revenue = float(data.get("Revenue", 0))
-            if revenue > 0:
-                revenues.append((fin.year, revenue))
-        
-        if len(revenues) >= 2:
-            revenues.sort(key=lambda x: x[0])
-            years = revenues[-1][0] - revenues[0][0]
-            if years > 0:
-                cagr = (revenues[-1][1] / revenues[0][1]) ** (1/years) - 1
-                return max(-0.5, min(1.0, cagr))  # Cap between -50% and 100%
-    except Exception as e:
-        logger.error(f"Historical growth calculation failed: {e}")
-    
-    return 0.0
+    years = np.asarray([fin.year for fin in financials], dtype=np.float64)
+    revenues, _, _, _, _ = _financial_metric_arrays(financials)
+    return _historical_growth_from_arrays(years, revenues)
+
+# Metrics a statement must report to count as fully consistent
+_REQUIRED_METRICS = frozenset({"Revenue", "Operating Income", "Net Income", "Operating Cash Flow"})
+
 
 def calculate_dcf_confidence(
     financials: List[Financial],
@@ -245,33 +381,42 @@ def calculate_dcf_confidence(
        - Business model stability
        - Market position
     """
-    # 1. Data Quality Score
-    data_quality = assess_data_completeness(financials)
-    years_of_data = len(set(f.year for f in financials))
-    historical_depth = min(1.0, years_of_data / 5)  # Prefer 5+ years
-    
-    # Calculate reporting consistency
-    required_metrics = {"Revenue", "Operating Income", "Net Income", "Operating Cash Flow"}
-    consistency_scores = []
-    
+    # Single pass over the records: years, metric coverage, and the
+    # revenue/operating-income columns all come out of one traversal
+    year_set = set()
+    years_list = []
+    revenues = []
+    op_incomes = []
+    covered = 0.0
+
     for fin in financials:
-        available_metrics = set(fin.data.get("values", {}).keys())
-        metric_coverage = len(required_metrics.intersection(available_metrics)) / len(required_metrics)
-        consistency_scores.append(metric_coverage)
-    
-    reporting_consistency = sum(consistency_scores) / len(consistency_scores) if consistency_scores else 0
-    
+        values = _values_of(fin)
+        year_set.add(fin.year)
+        years_list.append(fin.year)
+        revenues.append(_coerce_float(values.get("Revenue", 0)))
+        op_incomes.append(_coerce_float(values.get("Operating Income", 0)))
+        covered += sum(1 for m in _REQUIRED_METRICS if m in values) / len(_REQUIRED_METRICS)
+
+    years_arr = np.asarray(years_list, dtype=np.float64)
+    revenue_arr = np.asarray(revenues, dtype=np.float64)
+    op_income_arr = np.asarray(op_incomes, dtype=np.float64)
+
+    # 1. Data Quality Score
+    data_quality = assess_data_completeness(financials)["score"]
+    historical_depth = min(1.0, len(year_set) / 5)  # Prefer 5+ years
+    reporting_consistency = covered / len(financials) if financials else 0
+
     data_quality_score = 0.4 * data_quality + 0.3 * historical_depth + 0.3 * reporting_consistency
-    
+
     # 2. FCF Stability Score
     base_metrics = calculate_base_fcf(financials)
     fcf_stability = base_metrics["stability_score"]
-    margin_stability = _calculate_margin_stability(financials)
-    
+    margin_stability = _margin_stability_from_arrays(revenue_arr, op_income_arr)
+
     stability_score = 0.5 * fcf_stability + 0.5 * margin_stability
-    
+
     # 3. Growth Credibility
-    historical_growth = _calculate_historical_growth(financials)
+    historical_growth = _historical_growth_from_arrays(years_arr, revenue_arr)
     growth_deviation = 1.0 - min(1.0, abs(growth_rate - historical_growth) / max(abs(historical_growth), 0.05))
     
     # Assess if growth rate is reasonable given WACC
@@ -311,36 +456,6 @@ def calculate_dcf_confidence(
             "wacc_reasonableness": wacc_reasonableness
         }
     }
-    if not financials:
-        return 0.0
-    
-    # Data completeness score
-    completeness = len(financials) / 5.0  # Ideally want 5 years
-    
-    # Growth stability score
-    if len(financials) >= 2:
-        growths = []
-        for i in range(len(financials)-1):
-            try:
-                current = float(financials[i].data.get("operating_income", 0))
-                prev = float(financials[i+1].data.get("operating_income", 0))
-                if prev > 0:
-                    growths.append(abs((current/prev) - 1))
-            except:
-                continue
-        growth_stability = 1.0 - min(1.0, np.std(growths) if growths else 1.0)
-    else:
-        growth_stability = 0.0
-    
-    # Parameter reasonableness
-    growth_reasonable = 1.0 - min(1.0, abs(growth_rate) / 0.2)  # Penalize high growth
-    wacc_reasonable = 1.0 - min(1.0, abs(wacc - 0.1) / 0.1)  # Center around 10%
-    
-    # Weighted average
-    weights = [0.4, 0.3, 0.15, 0.15]
-    components = [completeness, growth_stability, growth_reasonable, wacc_reasonable]
-    
-    return sum(w * c for w, c in zip(weights, components))
 
 def generate_dcf_sensitivity_grid(
     base_fcf: float,
@@ -350,35 +465,38 @@ def generate_dcf_sensitivity_grid(
     growth_delta: float = 0.01,
     wacc_delta: float = 0.01
 ) -> Dict[str, Any]:
-    """Generate sensitivity analysis grid varying growth and WACC."""
-    growth_rates = [
-        growth_rate + i * growth_delta
-        for i in range(-2, 3)
-    ]
-    
-    wacc_rates = [
-        wacc + i * wacc_delta
-        for i in range(-2, 3)
-    ]
-    
-    grid = []
-    for g in growth_rates:
-        row = []
-        for w in wacc_rates:
-            # Simple 5-year DCF for sensitivity
-            fcfs = project_cash_flows(base_fcf, g, 5)
-            terminal = fcfs[-1] * (1 + terminal_growth) / (w - terminal_growth)
-            dfs = [(1 + w) ** -i for i in range(1, 6)]
-            value = sum(fcf * df for fcf, df in zip(fcfs, dfs)) + terminal * dfs[-1]
-            row.append(round(value, 1))
-        grid.append(row)
-    
+    """Generate sensitivity analysis grid varying growth and WACC.
+
+    The whole 5x5 grid is computed as a single NumPy broadcast instead of a
+    per-cell Python DCF loop.
+    """
+    growth_rates = growth_rate + np.arange(-2, 3) * growth_delta
+    wacc_rates = wacc + np.arange(-2, 3) * wacc_delta
+    years = np.arange(1, 6)
+
+    # Simple 5-year DCF per cell: FCF compounds at g, discounted at w
+    fcf_matrix = base_fcf * np.power(1.0 + growth_rates[:, None], years)  # (g, year)
+    df_matrix = np.power(1.0 + wacc_rates[:, None], -years)               # (w, year)
+
+    pv = fcf_matrix @ df_matrix.T                                         # (g, w)
+    terminal = (
+        fcf_matrix[:, -1][:, None] * (1 + terminal_growth)
+        / (wacc_rates[None, :] - terminal_growth)
+    )
+    values = pv + terminal * df_matrix[:, -1][None, :]
+
     return {
-        "growth_rates": growth_rates,
-        "wacc_rates": wacc_rates,
-        "values": grid
+        "growth_rates": growth_rates.tolist(),
+        "wacc_rates": wacc_rates.tolist(),
+        "values": np.round(values, 1).tolist()
     }
 
+# Completeness assessments keyed by the persisted Financial ids, same
+# scheme as the base-FCF and metric-matrix caches
+_completeness_cache: TTLCache = TTLCache(maxsize=2000, ttl=3600)
+_completeness_cache_lock = threading.Lock()
+
+
 def assess_data_completeness(financials: List[Financial]) -> Dict[str, Any]:
     """Assess completeness and quality of financial data."""
     required_fields = [
@@ -388,11 +506,19 @@ def assess_data_completeness(financials: List[Financial]) -> Dict[str, Any]:
         "capital_expenditure",
         "change_in_working_capital"
     ]
-    
+
     completeness = {}
     if not financials:
         return {"score": 0.0, "missing_fields": required_fields}
-    
+
+    cache_key = None
+    if all(getattr(fin, "id", None) is not None for fin in financials):
+        cache_key = tuple(fin.id for fin in financials)
+        with _completeness_cache_lock:
+            cached = _completeness_cache.get(cache_key)
+        if cached is not None:
+            return {**cached, "missing_fields": list(cached["missing_fields"])}
+
     missing = set()
     for field in required_fields:
         found = False
@@ -405,9 +531,13 @@ def assess_data_completeness(financials: List[Financial]) -> Dict[str, Any]:
     
     years_available = len(financials)
     field_completeness = (len(required_fields) - len(missing)) / len(required_fields)
-    
-    return {
+
+    result = {
         "score": min(years_available / 5.0, 1.0) * field_completeness,
         "years_available": years_available,
         "missing_fields": list(missing)
-    }
\ No newline at end of file
+    }
+    if cache_key is not None:
+        with _completeness_cache_lock:
+            _completeness_cache[cache_key] = result
+    return {**result, "missing_fields": list(result["missing_fields"])}
\ No newline at end of file